@@ -18,30 +18,31 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add project-specific model settings columns
-    op.add_column('projects', sa.Column('default_model', sa.String(100), nullable=True))
-    op.add_column('projects', sa.Column('temperature', sa.Float(), nullable=True))
-    op.add_column('projects', sa.Column('max_tokens', sa.Integer(), nullable=True))
-
-    # Add constraints
-    op.create_check_constraint(
-        'valid_project_temperature',
-        'projects',
-        'temperature IS NULL OR (temperature >= 0.0 AND temperature <= 2.0)'
-    )
-    op.create_check_constraint(
-        'positive_project_tokens',
-        'projects',
-        'max_tokens IS NULL OR max_tokens > 0'
+    # Add project-specific model settings columns and their constraints
+    # in a single ALTER TABLE
+    op.execute(
+        """
+        ALTER TABLE projects
+            ADD COLUMN default_model VARCHAR(100),
+            ADD COLUMN temperature FLOAT,
+            ADD COLUMN max_tokens INTEGER,
+            ADD CONSTRAINT valid_project_temperature
+                CHECK (temperature IS NULL OR (temperature >= 0.0 AND temperature <= 2.0)),
+            ADD CONSTRAINT positive_project_tokens
+                CHECK (max_tokens IS NULL OR max_tokens > 0)
+        """
     )
 
 
 def downgrade() -> None:
-    # Drop constraints
-    op.drop_constraint('positive_project_tokens', 'projects', type_='check')
-    op.drop_constraint('valid_project_temperature', 'projects', type_='check')
-
-    # Drop columns
-    op.drop_column('projects', 'max_tokens')
-    op.drop_column('projects', 'temperature')
-    op.drop_column('projects', 'default_model')
+    # Drop constraints and columns in a single ALTER TABLE
+    op.execute(
+        """
+        ALTER TABLE projects
+            DROP CONSTRAINT positive_project_tokens,
+            DROP CONSTRAINT valid_project_temperature,
+            DROP COLUMN max_tokens,
+            DROP COLUMN temperature,
+            DROP COLUMN default_model
+        """
+    )
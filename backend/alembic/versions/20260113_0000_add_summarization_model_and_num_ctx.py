@@ -18,28 +18,35 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add conversation_summarization_model column
-    op.add_column('settings', sa.Column('conversation_summarization_model', sa.String(100), nullable=False, server_default='llama3.2:3b-instruct-q4_K_M'))
-
-    # Add num_ctx column
-    op.add_column('settings', sa.Column('num_ctx', sa.Integer(), nullable=False, server_default='2048'))
-
-    # Add constraint for num_ctx
-    op.create_check_constraint(
-        'positive_num_ctx',
-        'settings',
-        'num_ctx > 0'
+    # Add both columns and the num_ctx constraint in a single ALTER TABLE,
+    # backfilling existing rows through the temporary defaults
+    op.execute(
+        """
+        ALTER TABLE settings
+            ADD COLUMN conversation_summarization_model VARCHAR(100) NOT NULL
+                DEFAULT 'llama3.2:3b-instruct-q4_K_M',
+            ADD COLUMN num_ctx INTEGER NOT NULL DEFAULT 2048,
+            ADD CONSTRAINT positive_num_ctx CHECK (num_ctx > 0)
+        """
     )
 
     # Remove server defaults after adding columns with values
-    op.alter_column('settings', 'conversation_summarization_model', server_default=None)
-    op.alter_column('settings', 'num_ctx', server_default=None)
+    op.execute(
+        """
+        ALTER TABLE settings
+            ALTER COLUMN conversation_summarization_model DROP DEFAULT,
+            ALTER COLUMN num_ctx DROP DEFAULT
+        """
+    )
 
 
 def downgrade() -> None:
-    # Drop constraint
-    op.drop_constraint('positive_num_ctx', 'settings', type_='check')
-
-    # Drop columns
-    op.drop_column('settings', 'num_ctx')
-    op.drop_column('settings', 'conversation_summarization_model')
+    # Drop constraint and columns in a single ALTER TABLE
+    op.execute(
+        """
+        ALTER TABLE settings
+            DROP CONSTRAINT positive_num_ctx,
+            DROP COLUMN num_ctx,
+            DROP COLUMN conversation_summarization_model
+        """
+    )
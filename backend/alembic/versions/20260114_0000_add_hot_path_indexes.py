@@ -0,0 +1,54 @@
+"""Add indexes for chat listing and message history queries
+
+Revision ID: 20260114_0000_abc
+Revises: 20260113_0000_abc
+Create Date: 2026-01-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260114_0000_abc'
+down_revision: Union[str, None] = '20260113_0000_abc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Message history for a chat, ordered by creation time
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_chat_id_created_at "
+            "ON messages (chat_id, created_at)"
+        )
+
+        # Chat listing filtered by project/archive status, newest first
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chats_project_archived_updated "
+            "ON chats (project_id, is_archived, updated_at DESC)"
+        )
+
+        # Default chat listing (archived chats excluded), newest first
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chats_active_updated_at "
+            "ON chats (updated_at DESC) WHERE is_archived = false"
+        )
+
+        # Foreign key lookups when a project file is deleted (the primary
+        # key leads with message_id, so it cannot serve file_id lookups)
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_message_files_file_id "
+            "ON message_files (file_id)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_message_files_file_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_chats_active_updated_at")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_chats_project_archived_updated")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_messages_chat_id_created_at")
@@ -0,0 +1,32 @@
+"""Add BRIN index on messages.created_at
+
+Revision ID: 20260114_0100_abc
+Revises: 20260114_0000_abc
+Create Date: 2026-01-14 01:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260114_0100_abc'
+down_revision: Union[str, None] = '20260114_0000_abc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Messages are append-only, so created_at follows physical row order and a
+    # BRIN index covers time-range scans at a fraction of a B-tree's size
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS brin_messages_created_at "
+            "ON messages USING BRIN (created_at) WITH (pages_per_range = 32)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS brin_messages_created_at")
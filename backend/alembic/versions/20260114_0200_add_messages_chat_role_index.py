@@ -0,0 +1,31 @@
+"""Add composite index on messages (chat_id, role, created_at)
+
+Revision ID: 20260114_0200_abc
+Revises: 20260114_0100_abc
+Create Date: 2026-01-14 02:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260114_0200_abc'
+down_revision: Union[str, None] = '20260114_0100_abc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves first-message lookups by role (title generation, first-response check)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_chat_id_role_created_at "
+            "ON messages (chat_id, role, created_at)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_messages_chat_id_role_created_at")
@@ -0,0 +1,31 @@
+"""Add composite index on project_files (project_id, created_at)
+
+Revision ID: 20260114_0300_abc
+Revises: 20260114_0200_abc
+Create Date: 2026-01-14 03:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260114_0300_abc'
+down_revision: Union[str, None] = '20260114_0200_abc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves a project's files in upload order (project details, prompt context)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_project_files_project_id_created_at "
+            "ON project_files (project_id, created_at)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_project_files_project_id_created_at")
@@ -0,0 +1,39 @@
+"""Add indexes for project listing and project chat listing
+
+Revision ID: 20260114_0500_abc
+Revises: 20260114_0300_abc
+Create Date: 2026-01-14 05:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260114_0500_abc'
+down_revision: Union[str, None] = '20260114_0300_abc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Chats of one project regardless of archive status, newest first
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chats_project_updated "
+            "ON chats (project_id, updated_at DESC)"
+        )
+
+        # Project listing filtered by archive status, newest first
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_projects_archived_updated "
+            "ON projects (is_archived, updated_at DESC)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_projects_archived_updated")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_chats_project_updated")
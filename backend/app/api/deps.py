@@ -5,15 +5,24 @@ from typing import Annotated, AsyncGenerator
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Path, status
-from sqlalchemy import select
+from sqlalchemy import bindparam, exists, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, lazyload, raiseload, selectinload
 
-from app.db.session import AsyncSessionLocal
+from app.db.models import Chat, Message, Project
+from app.db.session import AsyncSessionLocal, has_pending_writes
+
+# Built once and cached by the lambda's code location instead of per request
+PROJECT_EXISTS_STMT = lambda_stmt(
+    lambda: select(exists().where(Project.id == bindparam("project_id")))
+)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function to get database session.
+    Commits only when the request wrote something; read-only requests
+    skip the COMMIT and their transaction is released on close.
 
     Yields:
         AsyncSession: Database session
@@ -21,7 +30,8 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if has_pending_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -46,9 +56,75 @@ async def get_chat_or_404(
     Raises:
         HTTPException: 404 if chat not found
     """
-    from app.db.models import Chat
+    chat = await db.get(Chat, chat_id)
+
+    if not chat:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Chat {chat_id} not found",
+        )
+
+    return chat
+
+
+async def get_chat_with_messages_or_404(
+    chat_id: Annotated[UUID, Path(description="Chat UUID")],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """
+    Dependency to get a chat by ID with its messages loaded, or raise 404.
+
+    Args:
+        chat_id: Chat UUID from path
+        db: Database session
+
+    Returns:
+        Chat: The chat object with messages loaded
+
+    Raises:
+        HTTPException: 404 if chat not found
+    """
+    query = select(Chat).where(Chat.id == chat_id).options(selectinload(Chat.messages))
+    result = await db.execute(query)
+    chat = result.scalar_one_or_none()
+
+    if not chat:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Chat {chat_id} not found",
+        )
+
+    return chat
+
+
+async def get_chat_with_context_or_404(
+    chat_id: Annotated[UUID, Path(description="Chat UUID")],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """
+    Dependency to get a chat with everything needed to build a model prompt, or raise 404.
+    Loads the chat's settings, its project and its message history in one eager load;
+    the messages' attachments are skipped.
+
+    Args:
+        chat_id: Chat UUID from path
+        db: Database session
 
-    query = select(Chat).where(Chat.id == chat_id)
+    Returns:
+        Chat: The chat object with settings, project and messages loaded
+
+    Raises:
+        HTTPException: 404 if chat not found
+    """
+    query = (
+        select(Chat)
+        .where(Chat.id == chat_id)
+        .options(
+            joinedload(Chat.settings),
+            joinedload(Chat.project),
+            selectinload(Chat.messages).options(lazyload(Message.attached_files)),
+        )
+    )
     result = await db.execute(query)
     chat = result.scalar_one_or_none()
 
@@ -78,9 +154,44 @@ async def get_project_or_404(
     Raises:
         HTTPException: 404 if project not found
     """
-    from app.db.models import Project
+    project = await db.get(Project, project_id)
+
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found",
+        )
+
+    return project
+
+
+async def get_project_with_details_or_404(
+    project_id: Annotated[UUID, Path(description="Project UUID")],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """
+    Dependency to get a project with its files and chats, or raise 404.
+    Any other relationship, including each chat's messages, is left unloaded.
+
+    Args:
+        project_id: Project UUID from path
+        db: Database session
 
-    query = select(Project).where(Project.id == project_id)
+    Returns:
+        Project: The project object with files and chats loaded
+
+    Raises:
+        HTTPException: 404 if project not found
+    """
+    query = (
+        select(Project)
+        .where(Project.id == project_id)
+        .options(
+            selectinload(Project.files).raiseload("*"),
+            selectinload(Project.chats).raiseload("*"),
+            raiseload("*"),
+        )
+    )
     result = await db.execute(query)
     project = result.scalar_one_or_none()
 
@@ -91,3 +202,32 @@ async def get_project_or_404(
         )
 
     return project
+
+
+async def get_project_id_or_404(
+    project_id: Annotated[UUID, Path(description="Project UUID")],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> UUID:
+    """
+    Dependency to check that a project exists without loading it, or raise 404.
+    Use when an endpoint only needs the project's ID.
+
+    Args:
+        project_id: Project UUID from path
+        db: Database session
+
+    Returns:
+        UUID: The project ID
+
+    Raises:
+        HTTPException: 404 if project not found
+    """
+    found = await db.scalar(PROJECT_EXISTS_STMT, {"project_id": project_id})
+
+    if not found:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found",
+        )
+
+    return project_id
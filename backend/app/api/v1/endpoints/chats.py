@@ -1,12 +1,14 @@
 """
 API endpoints for chat management.
 """
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_chat_or_404, get_db
+from app.api.deps import get_chat_or_404, get_chat_with_messages_or_404, get_db
 from app.core.logging import get_logger
 from app.db.models import Chat, Message
 from app.schemas.chat import (
@@ -21,6 +23,32 @@ router = APIRouter()
 logger = get_logger(__name__)
 
 
+def _chat_response_columns():
+    """
+    Build the columns needed for a ChatResponse, including the message count.
+
+    Returns:
+        tuple: Chat columns plus a correlated message count subquery
+    """
+    message_count = (
+        select(func.count(Message.id))
+        .where(Message.chat_id == Chat.id)
+        .correlate(Chat)
+        .scalar_subquery()
+        .label("message_count")
+    )
+    return (
+        Chat.id,
+        Chat.title,
+        Chat.model,
+        Chat.is_archived,
+        Chat.project_id,
+        Chat.created_at,
+        Chat.updated_at,
+        message_count,
+    )
+
+
 @router.get("", response_model=ChatListResponse)
 async def list_chats(
     page: int = Query(1, ge=1, description="Page number"),
@@ -43,36 +71,35 @@ async def list_chats(
         ChatListResponse: Paginated list of chats
     """
     try:
-        # Build query
-        query = select(Chat)
+        # Build filter conditions shared by the page and count queries
+        conditions = []
         if not include_archived:
-            query = query.where(Chat.is_archived == False)
+            conditions.append(Chat.is_archived == False)
 
         # Filter by project_id if provided
         if project_id is not None:
             if project_id.lower() == "null" or project_id == "":
                 # Return standalone chats only
-                query = query.where(Chat.project_id.is_(None))
+                conditions.append(Chat.project_id.is_(None))
             else:
                 # Return chats for specific project
-                query = query.where(Chat.project_id == project_id)
-
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        result = await db.execute(count_query)
-        total = result.scalar() or 0
+                conditions.append(Chat.project_id == project_id)
 
-        # Get paginated results
-        query = query.order_by(Chat.updated_at.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
-        query = query.options(selectinload(Chat.messages))
+        # Get paginated results with message counts and the total aggregated in SQL
+        message_count_col = func.count(Message.id).label("message_count")
+        total_col = func.count().over().label("total")
+        page_query = select(Chat, message_count_col, total_col).where(*conditions)
+        page_query = page_query.outerjoin(Message, Message.chat_id == Chat.id).group_by(Chat.id)
+        page_query = page_query.order_by(Chat.updated_at.desc())
+        page_query = page_query.offset((page - 1) * page_size).limit(page_size)
 
-        result = await db.execute(query)
-        chats = result.scalars().all()
+        # Stream rows from a server-side cursor; each row carries the window total
+        result = await db.stream(page_query.execution_options(yield_per=page_size))
 
-        # Add message count to each chat
+        total = None
         chat_responses = []
-        for chat in chats:
+        async for chat, message_count, row_total in result:
+            total = row_total
             chat_dict = {
                 "id": chat.id,
                 "title": chat.title,
@@ -81,9 +108,18 @@ async def list_chats(
                 "project_id": chat.project_id,
                 "created_at": chat.created_at,
                 "updated_at": chat.updated_at,
-                "message_count": len(chat.messages),
+                "message_count": message_count,
             }
-            chat_responses.append(ChatResponse(**chat_dict))
+            chat_responses.append(ChatResponse.model_construct(**chat_dict))
+
+        if total is None:
+            if page > 1:
+                # Page is past the end, so no row carries the window total
+                count_query = select(func.count(Chat.id)).where(*conditions)
+                result = await db.execute(count_query)
+                total = result.scalar() or 0
+            else:
+                total = 0
 
         total_pages = (total + page_size - 1) // page_size
 
@@ -105,37 +141,27 @@ async def list_chats(
 
 @router.get("/{chat_id}", response_model=ChatWithMessagesResponse)
 async def get_chat(
-    chat: Chat = Depends(get_chat_or_404),
-    db: AsyncSession = Depends(get_db),
+    chat: Chat = Depends(get_chat_with_messages_or_404),
 ):
     """
     Get a specific chat with all messages.
 
     Args:
-        chat: Chat from dependency
-        db: Database session
+        chat: Chat with messages from dependency
 
     Returns:
         ChatWithMessagesResponse: Chat with messages
     """
-    # Load messages for the chat
-    query = select(Chat).where(Chat.id == chat.id).options(selectinload(Chat.messages))
-    result = await db.execute(query)
-    chat_with_messages = result.scalar_one()
-
-    # Sort messages by created_at
-    sorted_messages = sorted(chat_with_messages.messages, key=lambda m: m.created_at)
-
     return ChatWithMessagesResponse(
-        id=chat_with_messages.id,
-        title=chat_with_messages.title,
-        model=chat_with_messages.model,
-        is_archived=chat_with_messages.is_archived,
-        project_id=chat_with_messages.project_id,
-        created_at=chat_with_messages.created_at,
-        updated_at=chat_with_messages.updated_at,
-        message_count=len(sorted_messages),
-        messages=sorted_messages,
+        id=chat.id,
+        title=chat.title,
+        model=chat.model,
+        is_archived=chat.is_archived,
+        project_id=chat.project_id,
+        created_at=chat.created_at,
+        updated_at=chat.updated_at,
+        message_count=len(chat.messages),
+        messages=chat.messages,
     )
 
 
@@ -162,11 +188,10 @@ async def create_chat(
         )
         db.add(new_chat)
         await db.flush()
-        await db.refresh(new_chat)
 
         logger.info(f"Created chat {new_chat.id}")
 
-        return ChatResponse(
+        return ChatResponse.model_construct(
             id=new_chat.id,
             title=new_chat.title,
             model=new_chat.model,
@@ -177,6 +202,13 @@ async def create_chat(
             message_count=0,
         )
 
+    except IntegrityError:
+        # The projects foreign key rejects unknown project IDs
+        logger.warning(f"Cannot create chat for unknown project {chat_data.project_id}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Project {chat_data.project_id} not found",
+        )
     except Exception as e:
         logger.error(f"Error creating chat: {e}")
         raise HTTPException(
@@ -202,51 +234,51 @@ async def update_chat(
     Returns:
         ChatResponse: Updated chat
     """
-    # Update fields
-    if chat_data.title is not None:
-        chat.title = chat_data.title
-    if chat_data.model is not None:
-        chat.model = chat_data.model
-    if chat_data.is_archived is not None:
-        chat.is_archived = chat_data.is_archived
-
-    await db.flush()
-    await db.refresh(chat)
+    changes = chat_data.model_dump(exclude_none=True)
+
+    # Apply the changes and read back the chat with its message count in one statement
+    if changes:
+        query = (
+            update(Chat)
+            .where(Chat.id == chat.id)
+            .values(**changes)
+            .returning(*_chat_response_columns())
+        )
+    else:
+        query = select(*_chat_response_columns()).where(Chat.id == chat.id)
+    result = await db.execute(query)
+    row = result.one()
 
     logger.info(f"Updated chat {chat.id}")
 
-    # Get message count
-    count_query = select(func.count()).where(Message.chat_id == chat.id)
-    result = await db.execute(count_query)
-    message_count = result.scalar() or 0
-
-    return ChatResponse(
-        id=chat.id,
-        title=chat.title,
-        model=chat.model,
-        is_archived=chat.is_archived,
-        project_id=chat.project_id,
-        created_at=chat.created_at,
-        updated_at=chat.updated_at,
-        message_count=message_count,
-    )
+    return ChatResponse.model_construct(**row._mapping)
 
 
 @router.delete("/{chat_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_chat(
-    chat: Chat = Depends(get_chat_or_404),
+    chat_id: UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Delete a chat and all its messages.
+    Messages, chat settings and message file links are removed by the
+    database's ON DELETE CASCADE foreign keys.
 
     Args:
-        chat: Chat from dependency
+        chat_id: Chat UUID
         db: Database session
+
+    Raises:
+        HTTPException: 404 if chat not found
     """
-    chat_id = chat.id
-    await db.delete(chat)
-    await db.flush()
+    query = delete(Chat).where(Chat.id == chat_id).returning(Chat.id)
+    result = await db.execute(query)
+
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Chat {chat_id} not found",
+        )
 
     logger.info(f"Deleted chat {chat_id}")
 
@@ -266,24 +298,15 @@ async def archive_chat(
     Returns:
         ChatResponse: Archived chat
     """
-    chat.is_archived = True
-    await db.flush()
-    await db.refresh(chat)
+    query = (
+        update(Chat)
+        .where(Chat.id == chat.id)
+        .values(is_archived=True)
+        .returning(*_chat_response_columns())
+    )
+    result = await db.execute(query)
+    row = result.one()
 
     logger.info(f"Archived chat {chat.id}")
 
-    # Get message count
-    count_query = select(func.count()).where(Message.chat_id == chat.id)
-    result = await db.execute(count_query)
-    message_count = result.scalar() or 0
-
-    return ChatResponse(
-        id=chat.id,
-        title=chat.title,
-        model=chat.model,
-        is_archived=chat.is_archived,
-        project_id=chat.project_id,
-        created_at=chat.created_at,
-        updated_at=chat.updated_at,
-        message_count=message_count,
-    )
+    return ChatResponse.model_construct(**row._mapping)
@@ -2,20 +2,25 @@
 API endpoints for message management and streaming.
 """
 import asyncio
-import json
-from typing import List
+import io
+import logging
+import random
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, List, Optional, Set, Tuple, TypeVar
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import StreamingResponse
-from sqlalchemy import func, select
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import bindparam, func, insert, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_chat_or_404, get_db
+from app.api.deps import get_chat_or_404, get_chat_with_context_or_404, get_db
 from app.core.config import settings
 from app.core.logging import get_logger
-from app.db.models import Chat, ChatSettings, Message, Project, ProjectFile, Settings
+from app.db.models import Chat, Message, ProjectFile, Settings
+from app.db.session import AsyncSessionLocal
 from app.schemas.message import MessageCreate, MessageListResponse, MessageResponse
 from app.services.ollama_service import ollama_service
 from app.utils.exceptions import OllamaConnectionError
@@ -23,12 +28,128 @@ from app.utils.exceptions import OllamaConnectionError
 router = APIRouter()
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Statements run on every stream are built once and cached by their lambda's code
+# location, so each call skips statement construction and cache-key generation
+FILE_SIGNATURE_STMT = lambda_stmt(
+    lambda: select(func.max(ProjectFile.updated_at), func.count()).where(
+        ProjectFile.project_id == bindparam("project_id")
+    )
+)
+# Fetching at most two rows is enough to tell "exactly one" apart from "more"
+ASSISTANT_IDS_STMT = lambda_stmt(
+    lambda: select(Message.id).where(
+        Message.chat_id == bindparam("chat_id"),
+        Message.role == "assistant",
+    ).limit(2)
+)
+
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-run
+_background_tasks: Set[asyncio.Task] = set()
+
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+
+# Coalesce streamed tokens into one SSE frame per size or time window
+STREAM_FLUSH_BYTES = 16384
+STREAM_FLUSH_INTERVAL = 0.02
+
+# Admission control: streams beyond this limit wait for a free slot before calling Ollama
+STREAM_SLOTS = asyncio.Semaphore(settings.max_concurrent_streams)
+
+# Project file context keyed by project, tagged with (max file updated_at, file count)
+FILE_CONTEXT_CACHE_SIZE = 64
+_file_context_cache: "OrderedDict[UUID, Tuple[Tuple[Optional[datetime], int], str]]" = OrderedDict()
+
+
+def _get_cached_file_context(project_id: UUID, signature: Tuple[Optional[datetime], int]) -> Optional[str]:
+    """
+    Look up the cached file context for a project.
+
+    Args:
+        project_id: Project UUID
+        signature: Current (max file updated_at, file count) for the project
+
+    Returns:
+        Optional[str]: Cached file context, or None if missing or stale
+    """
+    entry = _file_context_cache.get(project_id)
+    if entry is None or entry[0] != signature:
+        return None
+    _file_context_cache.move_to_end(project_id)
+    return entry[1]
+
+
+def _cache_file_context(project_id: UUID, signature: Tuple[Optional[datetime], int], file_context: str) -> None:
+    """
+    Store the file context for a project, evicting the least recently used entry when full.
+
+    Args:
+        project_id: Project UUID
+        signature: (max file updated_at, file count) the context was built from
+        file_context: Joined file context for the system prompt
+    """
+    _file_context_cache[project_id] = (signature, file_context)
+    _file_context_cache.move_to_end(project_id)
+    if len(_file_context_cache) > FILE_CONTEXT_CACHE_SIZE:
+        _file_context_cache.popitem(last=False)
+
+
+def _sse_event(payload: dict) -> bytes:
+    """
+    Encode a payload as a server-sent event frame.
+
+    Args:
+        payload: JSON-serializable event data
+
+    Returns:
+        bytes: Encoded ``data:`` frame
+    """
+    return SSE_PREFIX + orjson.dumps(payload) + SSE_SUFFIX
+
+
+async def _retry_with_backoff(
+    fn: Callable[[], Awaitable[T]],
+    max_retries: int = 3,
+    base: float = 1.0,
+    cap: float = 30.0,
+    jitter: float = 0.5,
+) -> T:
+    """
+    Call an async function, retrying connection failures with jittered exponential backoff.
+
+    Args:
+        fn: Zero-argument coroutine function to call
+        max_retries: Number of retries after the first attempt
+        base: Delay in seconds before the first retry
+        cap: Upper bound on the un-jittered delay in seconds
+        jitter: Maximum extra delay as a fraction of the base delay
+
+    Returns:
+        T: Result of the first successful call
+
+    Raises:
+        OllamaConnectionError: If every attempt fails to connect
+        Exception: Any other error is raised immediately without retrying
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await fn()
+        except OllamaConnectionError as e:
+            if attempt == max_retries:
+                raise
+            delay = min(cap, base * 2**attempt) * (1 + random.random() * jitter)
+            logger.warning(f"Attempt {attempt + 1}/{max_retries + 1} failed: {e}. Retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
 
 async def generate_and_update_title(session: AsyncSession, chat_id: UUID) -> None:
     """
     Generate title for a chat after 1st assistant response.
     Uses first user message and first assistant message as context.
-    Implements retry logic: retries once on failure.
+    The title is only applied if the chat still has the default title.
+    Retries connection failures with jittered exponential backoff.
 
     Args:
         session: Database session
@@ -39,74 +160,59 @@ async def generate_and_update_title(session: AsyncSession, chat_id: UUID) -> Non
         return
 
     try:
-        # First, check if the chat already has a custom title (not "New Chat")
-        chat_query = select(Chat).where(Chat.id == chat_id)
-        result = await session.execute(chat_query)
-        chat = result.scalar_one_or_none()
-
-        if not chat:
-            logger.warning(f"Chat {chat_id} not found")
-            return
-
-        # Skip title generation if chat already has a custom title
-        if chat.title != "New Chat":
-            logger.info(f"Chat {chat_id} already has custom title '{chat.title}', skipping generation")
-            return
-
         logger.info(f"Starting title generation for chat {chat_id}")
 
-        # Query first user message
+        # Query first user message content
         user_messages_query = (
-            select(Message)
+            select(Message.content)
             .where(Message.chat_id == chat_id, Message.role == "user")
             .order_by(Message.created_at.asc())
             .limit(1)
         )
         result = await session.execute(user_messages_query)
-        user_messages = result.scalars().all()
+        user_contents = list(result.scalars().all())
 
-        # Query first assistant message
+        # Query first assistant message content
         assistant_messages_query = (
-            select(Message)
+            select(Message.content)
             .where(Message.chat_id == chat_id, Message.role == "assistant")
             .order_by(Message.created_at.asc())
             .limit(1)
         )
         result = await session.execute(assistant_messages_query)
-        assistant_messages = result.scalars().all()
-
-        # Extract content into lists
-        user_contents = [msg.content for msg in user_messages]
-        assistant_contents = [msg.content for msg in assistant_messages]
+        assistant_contents = list(result.scalars().all())
 
         if not user_contents or not assistant_contents:
             logger.warning(f"Insufficient messages for title generation in chat {chat_id}")
             return
 
-        # Try generating title with retry logic
-        title = None
-        max_attempts = 2
-
-        for attempt in range(1, max_attempts + 1):
-            try:
-                logger.info(f"Title generation attempt {attempt}/{max_attempts} for chat {chat_id}")
-                title = await ollama_service.generate_chat_title(user_contents, assistant_contents)
-                break  # Success, exit retry loop
-            except Exception as e:
-                logger.error(f"Title generation failed (attempt {attempt}/{max_attempts}): {e}")
-                if attempt < max_attempts:
-                    # Wait 2 seconds before retry
-                    logger.info(f"Retrying title generation in 2 seconds...")
-                    await asyncio.sleep(2)
-                else:
-                    logger.error(f"Title generation failed after {max_attempts} attempts, keeping default title")
-                    return
+        # End the read transaction so no pool connection is held during the model call;
+        # the title update below runs in its own short transaction
+        await session.commit()
+
+        # Try generating title, backing off between connection failures
+        try:
+            title = await _retry_with_backoff(
+                lambda: ollama_service.generate_chat_title(user_contents, assistant_contents)
+            )
+        except Exception as e:
+            logger.error(f"Title generation failed for chat {chat_id}, keeping default title: {e}")
+            return
 
-        # Update chat title in database
+        # Update chat title in database, only if it still has the default title so
+        # a custom title set in the meantime is never overwritten
         if title and title != "New Chat":
-            chat.title = title
-            await session.flush()
-            logger.info(f"Updated chat {chat_id} title to: '{title}'")
+            update_query = (
+                update(Chat)
+                .where(Chat.id == chat_id, Chat.title == "New Chat")
+                .values(title=title)
+                .returning(Chat.id)
+            )
+            result = await session.execute(update_query)
+            if result.scalar_one_or_none() is None:
+                logger.info(f"Chat {chat_id} was renamed or deleted, skipping generated title '{title}'")
+            else:
+                logger.info(f"Updated chat {chat_id} title to: '{title}'")
         else:
             logger.warning(f"Invalid title generated for chat {chat_id}, keeping default")
 
@@ -114,7 +220,19 @@ async def generate_and_update_title(session: AsyncSession, chat_id: UUID) -> Non
         logger.error(f"Unexpected error in generate_and_update_title for chat {chat_id}: {e}")
 
 
-@router.get("/{chat_id}/messages", response_model=MessageListResponse)
+async def _background_title(chat_id: UUID) -> None:
+    """
+    Generate a chat title in its own session, outside the request's stream.
+
+    Args:
+        chat_id: Chat UUID
+    """
+    async with AsyncSessionLocal() as session:
+        await generate_and_update_title(session, chat_id)
+        await session.commit()
+
+
+@router.get("/{chat_id}/messages", response_model=MessageListResponse, response_class=ORJSONResponse)
 async def list_messages(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=200, description="Items per page"),
@@ -131,32 +249,61 @@ async def list_messages(
         db: Database session
 
     Returns:
-        MessageListResponse: Paginated list of messages
+        ORJSONResponse: Paginated list of messages (MessageListResponse shape)
     """
-    # Get total count
-    count_query = select(func.count()).where(Message.chat_id == chat.id)
-    result = await db.execute(count_query)
-    total = result.scalar() or 0
-
-    # Get paginated messages
+    # Get paginated messages with the total aggregated in SQL
     query = (
-        select(Message)
+        select(Message, func.count().over().label("total"))
         .where(Message.chat_id == chat.id)
         .order_by(Message.created_at.asc())
         .offset((page - 1) * page_size)
         .limit(page_size)
     )
     result = await db.execute(query)
-    messages = result.scalars().all()
+    rows = result.all()
+
+    messages = [message for message, _ in rows]
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        # Page is past the end, so no row carries the window total
+        count_query = select(func.count()).where(Message.chat_id == chat.id)
+        result = await db.execute(count_query)
+        total = result.scalar() or 0
+    else:
+        total = 0
 
     total_pages = (total + page_size - 1) // page_size
 
-    return MessageListResponse(
-        messages=[MessageResponse.model_validate(m) for m in messages],
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
+    # Serialize straight to orjson; returning a response skips response_model
+    # validation and jsonable_encoder (orjson handles UUIDs and datetimes natively)
+    return ORJSONResponse(
+        {
+            "messages": [
+                {
+                    "id": m.id,
+                    "chat_id": m.chat_id,
+                    "role": m.role,
+                    "content": m.content,
+                    "tokens_used": m.tokens_used,
+                    "attached_files": [
+                        {
+                            "id": f.id,
+                            "filename": f.filename,
+                            "file_type": f.file_type,
+                            "file_size": f.file_size,
+                        }
+                        for f in m.attached_files
+                    ],
+                    "created_at": m.created_at,
+                }
+                for m in messages
+            ],
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+        }
     )
 
 
@@ -178,15 +325,16 @@ async def create_message(
     Returns:
         MessageResponse: Created message
     """
-    # Create user message
+    # Create user message; attached_files starts empty so serializing it
+    # does not trigger a lazy load
     new_message = Message(
         chat_id=chat.id,
         role="user",
         content=message_data.content,
+        attached_files=[],
     )
     db.add(new_message)
     await db.flush()
-    await db.refresh(new_message)
 
     logger.info(f"Created message in chat {chat.id}")
 
@@ -195,9 +343,8 @@ async def create_message(
 
 @router.get("/{chat_id}/stream")
 async def stream_chat_response(
-    chat_id: UUID,
     message: str = Query(..., min_length=1, max_length=32000, description="User message"),
-    db: AsyncSession = Depends(get_db),
+    chat: Chat = Depends(get_chat_with_context_or_404),
 ):
     """
     Send a message and stream the Ollama response in real-time.
@@ -205,57 +352,34 @@ async def stream_chat_response(
     For project chats, all project files are automatically included as context.
 
     Args:
-        chat_id: Chat UUID
         message: User message content
-        db: Database session
+        chat: Chat with settings, project and history from dependency
 
     Returns:
         StreamingResponse: Server-sent events stream
 
     Raises:
-        HTTPException: If chat not found or Ollama error
+        HTTPException: 404 if chat not found
     """
     import uuid as uuid_lib
     request_id = str(uuid_lib.uuid4())[:8]  # Short request ID for tracking
+    chat_id = chat.id
     logger.info(f"[Req {request_id}] Stream endpoint called for chat {chat_id}, message: '{message[:50]}...'")
 
     async def event_generator():
         session: AsyncSession = None
         try:
             logger.info(f"[Req {request_id}] Starting event generator")
-            # Create new session for streaming
-            from app.db.session import AsyncSessionLocal
-
+            # Create new session for streaming; the chat and its context are already
+            # loaded by the dependency, so this session is only used for settings,
+            # project files and message writes
             session = AsyncSessionLocal()
 
-            # Get chat and verify it exists
-            chat_query = select(Chat).where(Chat.id == chat_id)
-            result = await session.execute(chat_query)
-            chat = result.scalar_one_or_none()
-
-            if not chat:
-                error_data = json.dumps({"error": f"Chat {chat_id} not found"})
-                yield f"data: {error_data}\n\n"
-                return
-
             # Get global settings
-            settings_query = select(Settings).where(Settings.id == 1)
-            result = await session.execute(settings_query)
-            global_settings = result.scalar_one_or_none()
+            global_settings = await session.get(Settings, 1)
 
-            # Get chat settings for temperature and max_tokens
-            chat_settings_query = select(ChatSettings).where(
-                ChatSettings.chat_id == chat_id
-            )
-            result = await session.execute(chat_settings_query)
-            chat_settings = result.scalar_one_or_none()
-
-            # Get project settings if chat belongs to a project (query executed later for custom_instructions)
-            project = None
-            if chat.project_id:
-                project_query = select(Project).where(Project.id == chat.project_id)
-                result = await session.execute(project_query)
-                project = result.scalar_one_or_none()
+            chat_settings = chat.settings
+            project = chat.project
 
             # Determine temperature: chat → project → global → hardcoded default
             temperature = None
@@ -279,179 +403,205 @@ async def stream_chat_response(
             else:
                 max_tokens = 2048
 
-            # Get chat history
-            messages_query = (
-                select(Message)
-                .where(Message.chat_id == chat_id)
-                .order_by(Message.created_at.asc())
-            )
-            result = await session.execute(messages_query)
-            history = result.scalars().all()
-
-            # Build message history for Ollama
-            ollama_messages = [
-                {"role": msg.role, "content": msg.content} for msg in history
-            ]
-
-            # Build system prompt with project context
-            system_prompt_parts = []
+            # Build system prompt with project context in a single buffer
+            system_prompt = io.StringIO()
 
             # Add project context if project exists and has custom instructions
             if project and project.custom_instructions:
-                system_prompt_parts.append("Project Context:")
-                system_prompt_parts.append(project.custom_instructions)
-                system_prompt_parts.append("")  # Empty line for spacing
+                system_prompt.write("Project Context:\n")
+                system_prompt.write(project.custom_instructions)
+                system_prompt.write("\n\n")  # Empty line for spacing
 
             # Automatically load ALL project files for project chats and add to system prompt
             if chat.project_id:
                 logger.info(f"[Req {request_id}] Chat {chat_id} belongs to project {chat.project_id}, loading project files")
-                # Load all files from the project with explicit content loading
-                files_query = select(ProjectFile).where(
-                    ProjectFile.project_id == chat.project_id
-                ).order_by(ProjectFile.created_at.asc())
-
-                # Execute query and materialize results immediately
-                result = await session.execute(files_query)
-                files = list(result.scalars().all())
-
-                logger.info(f"Loaded {len(files)} files from database for project {chat.project_id}")
+                # Any file insert, update or delete changes this signature
+                result = await session.execute(
+                    FILE_SIGNATURE_STMT, {"project_id": chat.project_id}
+                )
+                signature = tuple(result.one())
+
+                file_context = _get_cached_file_context(chat.project_id, signature)
+                if file_context is not None:
+                    logger.info(f"Using cached file context for project {chat.project_id} ({signature[1]} files)")
+                else:
+                    # Load only the columns the prompt needs, as plain rows
+                    files_query = select(
+                        ProjectFile.filename, ProjectFile.file_type, ProjectFile.content
+                    ).where(
+                        ProjectFile.project_id == chat.project_id
+                    ).order_by(ProjectFile.created_at.asc())
 
-                if files:
-                    logger.info(f"Auto-attaching {len(files)} project file(s) to chat {chat_id}")
+                    # Stream files from a server-side cursor instead of materializing them all at once
+                    files = await session.stream(files_query.execution_options(yield_per=16))
 
-                    # Add all file contents to the system prompt
-                    # Access all file attributes now while session is active
-                    file_context_parts = []
+                    file_context_buffer = io.StringIO()
                     total_file_chars = 0
-                    for file in files:
-                        # Access all attributes immediately to avoid lazy loading issues
-                        filename = str(file.filename)
-                        file_type = str(file.file_type)
-                        file_content = str(file.content) if file.content is not None else ""
+                    file_count = 0
+                    async for filename, file_type, file_content in files:
+                        if file_count:
+                            file_context_buffer.write("\n\n")
+                        file_count += 1
+                        file_content = file_content or ""
                         total_file_chars += len(file_content)
-                        logger.info(
-                            f"Including file {filename} ({file_type}, {len(file_content)} chars) "
-                            f"as context for chat {chat_id}"
-                        )
-                        file_context_parts.append(f"[File: {filename}]\n{file_content}\n[End of File]")
-
-                    # Add file context to system prompt
-                    system_prompt_parts.append("Project Files:")
-                    system_prompt_parts.append("\n\n".join(file_context_parts))
-                    system_prompt_parts.append("")  # Empty line for spacing
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                f"Including file {filename} ({file_type}, {len(file_content)} chars) "
+                                f"as context for chat {chat_id}"
+                            )
+                        file_context_buffer.write("[File: ")
+                        file_context_buffer.write(filename)
+                        file_context_buffer.write("]\n")
+                        file_context_buffer.write(file_content)
+                        file_context_buffer.write("\n[End of File]")
+
+                    file_context = file_context_buffer.getvalue()
+                    _cache_file_context(chat.project_id, signature, file_context)
 
                     logger.info(
-                        f"Total context size: {total_file_chars} chars from {len(files)} files added to system prompt"
+                        f"Loaded {file_count} files ({total_file_chars} chars) from project {chat.project_id} "
+                        f"for chat {chat_id}"
                     )
+
+                if file_context:
+                    logger.info(f"Auto-attaching {signature[1]} project file(s) to chat {chat_id}")
+
+                    # Add file context to system prompt
+                    system_prompt.write("Project Files:\n")
+                    system_prompt.write(file_context)
+                    system_prompt.write("\n\n")  # Empty line for spacing
                 else:
                     logger.info(f"No files found in project {chat.project_id} for chat {chat_id}")
 
-            # Insert combined system prompt if we have any content
-            if system_prompt_parts:
-                combined_prompt = "\n".join(system_prompt_parts)
-                ollama_messages.insert(0, {"role": "system", "content": combined_prompt})
+            combined_prompt = system_prompt.getvalue()[:-1]  # Drop the final spacing newline
+            system_prompt_chars = len(combined_prompt)
+
+            # Start with the combined system prompt if we have any content, so the
+            # history never has to be shifted to insert it at the front
+            ollama_messages = []
+            if combined_prompt:
+                ollama_messages.append({"role": "system", "content": combined_prompt})
 
                 # Log the complete system prompt
-                logger.info("=" * 80)
-                logger.info("SYSTEM PROMPT:")
-                logger.info("=" * 80)
-                logger.info(combined_prompt)
-                logger.info("=" * 80)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("=" * 80)
+                    logger.debug("SYSTEM PROMPT:")
+                    logger.debug("=" * 80)
+                    logger.debug(combined_prompt)
+                    logger.debug("=" * 80)
+
+            # Add message history (messages load ordered by created_at)
+            ollama_messages.extend({"role": msg.role, "content": msg.content} for msg in chat.messages)
 
             # Add new user message (original message without file contents)
             ollama_messages.append({"role": "user", "content": message})
 
-            # Log the full message content being sent to Ollama for debugging
             logger.info(
-                f"Sending to Ollama - Chat {chat_id}, User message length: {len(message)} chars, "
-                f"Number of messages in history: {len(ollama_messages)}"
+                f"Sending to Ollama - Chat {chat_id}, messages: {len(ollama_messages)}, "
+                f"system prompt: {system_prompt_chars} chars, user message: {len(message)} chars"
             )
 
             # Debug: Log all messages being sent to Ollama
-            logger.info("=" * 80)
-            logger.info("MESSAGES BEING SENT TO OLLAMA:")
-            logger.info("=" * 80)
-            for idx, msg in enumerate(ollama_messages):
-                logger.info(f"Message {idx + 1} - Role: {msg['role']}")
-                content = msg['content']
-                if len(content) > 1000:
-                    logger.info(f"Content (first 500 chars): {content[:500]}")
-                    logger.info(f"... [{len(content) - 1000} chars omitted] ...")
-                    logger.info(f"Content (last 500 chars): {content[-500:]}")
-                else:
-                    logger.info(f"Content: {content}")
-                logger.info("-" * 80)
-            logger.info("=" * 80)
-
-            # Save user message to database
-            user_message = Message(
-                chat_id=chat_id,
-                role="user",
-                content=message,  # Store original message without file contents
-            )
-            session.add(user_message)
-            await session.flush()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("=" * 80)
+                logger.debug("MESSAGES BEING SENT TO OLLAMA:")
+                logger.debug("=" * 80)
+                for idx, msg in enumerate(ollama_messages):
+                    logger.debug(f"Message {idx + 1} - Role: {msg['role']}")
+                    content = msg['content']
+                    if len(content) > 1000:
+                        logger.debug(f"Content (first 500 chars): {content[:500]}")
+                        logger.debug(f"... [{len(content) - 1000} chars omitted] ...")
+                        logger.debug(f"Content (last 500 chars): {content[-500:]}")
+                    else:
+                        logger.debug(f"Content: {content}")
+                    logger.debug("-" * 80)
+                logger.debug("=" * 80)
 
             # Note: We don't need to associate files with the message in the database
             # since all project files are automatically included as context.
             # The message_files relationship is kept for potential future use
             # (e.g., selective file attachment or file change tracking).
 
+            # Release the streaming session's connection back to the pool before the
+            # (potentially long) Ollama call; the messages are written afterwards
+            user_message_created_at = datetime.now(timezone.utc)
+            await session.close()
+
             logger.info(f"Starting stream for chat {chat_id}")
 
-            # Stream response from Ollama
-            full_response = ""
-            async for chunk in ollama_service.stream_chat(
-                model=chat.model,
-                messages=ollama_messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-            ):
-                full_response += chunk
-                chunk_data = json.dumps({"content": chunk, "done": False})
-                yield f"data: {chunk_data}\n\n"
-
-            # Save assistant message to database
-            assistant_message = Message(
-                chat_id=chat_id,
-                role="assistant",
-                content=full_response,
+            # Stream response from Ollama, holding one of the limited stream slots
+            chunks: List[str] = []
+            loop = asyncio.get_running_loop()
+            buffer = bytearray()
+            async with STREAM_SLOTS:
+                last_flush = loop.time()
+                async for chunk in ollama_service.stream_chat(
+                    model=chat.model,
+                    messages=ollama_messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                ):
+                    chunks.append(chunk)
+                    buffer += chunk.encode()
+                    if len(buffer) >= STREAM_FLUSH_BYTES or loop.time() - last_flush >= STREAM_FLUSH_INTERVAL:
+                        yield _sse_event({"content": buffer.decode(), "done": False})
+                        buffer.clear()
+                        last_flush = loop.time()
+
+                # Flush tokens still waiting in the buffer
+                if buffer:
+                    yield _sse_event({"content": buffer.decode(), "done": False})
+
+            full_response = "".join(chunks)
+
+            # Save user and assistant messages to database in one short transaction,
+            # with Core inserts since the ORM objects are never used
+            await session.execute(
+                insert(Message),
+                [
+                    {
+                        "chat_id": chat_id,
+                        "role": "user",
+                        "content": message,  # Store original message without file contents
+                        "created_at": user_message_created_at,
+                    },
+                    {
+                        "chat_id": chat_id,
+                        "role": "assistant",
+                        "content": full_response,
+                    },
+                ],
             )
-            session.add(assistant_message)
             await session.commit()
 
             logger.info(f"Completed stream for chat {chat_id}")
 
             # Check if this is the 1st assistant response and trigger title generation
-            message_count_query = select(func.count()).where(
-                Message.chat_id == chat_id,
-                Message.role == "assistant"
-            )
-            result = await session.execute(message_count_query)
-            assistant_count = result.scalar() or 0
+            result = await session.execute(ASSISTANT_IDS_STMT, {"chat_id": chat_id})
+            assistant_rows = result.all()
 
-            if assistant_count == 1:
+            if len(assistant_rows) == 1:
                 logger.info(f"First assistant response completed for chat {chat_id}, triggering title generation")
-                await generate_and_update_title(session, chat_id)
-                await session.commit()  # Commit title update
+                # Run in the background so the client gets the done frame right away
+                task = asyncio.create_task(_background_title(chat_id))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
 
             # Send completion signal
-            done_data = json.dumps({"content": "", "done": True})
-            yield f"data: {done_data}\n\n"
+            yield _sse_event({"content": "", "done": True})
 
         except OllamaConnectionError as e:
             logger.error(f"Ollama connection error: {e}")
-            error_data = json.dumps(
+            yield _sse_event(
                 {
                     "error": "Unable to connect to Ollama",
                     "detail": "Please ensure Ollama is running",
                 }
             )
-            yield f"data: {error_data}\n\n"
         except Exception as e:
             logger.error(f"Error in stream: {e}")
-            error_data = json.dumps({"error": "Internal server error", "detail": str(e)})
-            yield f"data: {error_data}\n\n"
+            yield _sse_event({"error": "Internal server error", "detail": str(e)})
         finally:
             if session:
                 await session.close()
@@ -1,8 +1,14 @@
 """
 API endpoints for Ollama model management.
 """
-from fastapi import APIRouter, HTTPException, status
+import asyncio
+import hashlib
+from typing import Dict, Optional, Union
 
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel
+
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.schemas.ollama import OllamaModelListResponse, OllamaStatusResponse
 from app.services.ollama_service import ollama_service
@@ -11,11 +17,55 @@ from app.utils.exceptions import OllamaConnectionError
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Short client-side freshness; revalidation after that is answered with 304 when unchanged
+CACHE_CONTROL = "private, max-age=5"
+
+# Latest status from the background health check, served by /status without contacting Ollama
+_status_cache: Optional[OllamaStatusResponse] = None
+
+
+def _cache_headers(payload: BaseModel) -> Dict[str, str]:
+    """
+    Build caching headers with a weak ETag derived from a response payload.
+
+    Args:
+        payload: Response model that will be returned
+
+    Returns:
+        Dict[str, str]: ETag and Cache-Control headers
+    """
+    digest = hashlib.blake2b(payload.model_dump_json().encode(), digest_size=12).hexdigest()
+    return {"ETag": f'W/"{digest}"', "Cache-Control": CACHE_CONTROL}
+
+
+def _conditional(request: Request, response: Response, payload: BaseModel) -> Union[BaseModel, Response]:
+    """
+    Return 304 Not Modified if the client already has this payload, else the payload with caching headers.
+
+    Args:
+        request: Incoming request
+        response: Response whose headers are set
+        payload: Response model to return
+
+    Returns:
+        Union[BaseModel, Response]: Empty 304 response or the payload
+    """
+    headers = _cache_headers(payload)
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return payload
+
 
 @router.get("/models", response_model=OllamaModelListResponse)
-async def list_ollama_models():
+async def list_ollama_models(request: Request, response: Response):
     """
     Get list of available Ollama models.
+    Supports conditional requests via ETag / If-None-Match.
+
+    Args:
+        request: Incoming request
+        response: Outgoing response
 
     Returns:
         OllamaModelListResponse: List of available models
@@ -25,7 +75,7 @@ async def list_ollama_models():
     """
     try:
         models = await ollama_service.get_models()
-        return OllamaModelListResponse(models=models)
+        return _conditional(request, response, OllamaModelListResponse(models=models))
     except OllamaConnectionError as e:
         logger.error(f"Error retrieving Ollama models: {e}")
         raise HTTPException(
@@ -44,17 +94,23 @@ async def list_ollama_models():
         )
 
 
-@router.get("/status", response_model=OllamaStatusResponse)
-async def check_ollama_status():
+async def _probe_status() -> OllamaStatusResponse:
     """
-    Check Ollama connection status.
+    Query Ollama for its health and model count.
 
     Returns:
         OllamaStatusResponse: Connection status and model count
     """
     try:
-        await ollama_service.check_health()
-        models = await ollama_service.get_models()
+        # Both calls hit Ollama independently, so overlap their round trips
+        health, models = await asyncio.gather(
+            ollama_service.check_health(),
+            ollama_service.get_models(),
+            return_exceptions=True,
+        )
+        for outcome in (health, models):
+            if isinstance(outcome, BaseException):
+                raise outcome
         return OllamaStatusResponse(
             connected=True,
             url=ollama_service.base_url,
@@ -74,3 +130,55 @@ async def check_ollama_status():
             url=ollama_service.base_url,
             error="Unknown error",
         )
+
+
+async def refresh_ollama_status() -> OllamaStatusResponse:
+    """
+    Probe Ollama and store the result as the current status.
+
+    Returns:
+        OllamaStatusResponse: Connection status and model count
+    """
+    global _status_cache
+
+    _status_cache = await _probe_status()
+    return _status_cache
+
+
+async def ollama_health_loop() -> None:
+    """
+    Refresh the cached Ollama status every OLLAMA_HEALTH_INTERVAL seconds.
+    Runs until cancelled on application shutdown.
+    """
+    while True:
+        await asyncio.sleep(settings.ollama_health_interval)
+        try:
+            await refresh_ollama_status()
+        except Exception as e:
+            logger.error(f"Background Ollama health check failed: {e}")
+
+
+@router.get("/status", response_model=OllamaStatusResponse)
+async def check_ollama_status(
+    request: Request,
+    response: Response,
+    live: bool = Query(False, description="Probe Ollama now instead of returning the cached status"),
+):
+    """
+    Check Ollama connection status.
+    Served from the background health check unless a live probe is requested.
+    Supports conditional requests via ETag / If-None-Match.
+
+    Args:
+        request: Incoming request
+        response: Outgoing response
+        live: Probe Ollama now and refresh the cached status
+
+    Returns:
+        OllamaStatusResponse: Connection status and model count
+    """
+    result = _status_cache
+    if live or result is None:
+        result = await refresh_ollama_status()
+
+    return _conditional(request, response, result)
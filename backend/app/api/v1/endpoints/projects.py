@@ -1,19 +1,33 @@
 """
 API endpoints for project management.
 """
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Text, bindparam, delete, func, insert, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, undefer
 
-from app.api.deps import get_db, get_project_or_404
+from app.api.deps import (
+    get_db,
+    get_project_id_or_404,
+    get_project_or_404,
+    get_project_with_details_or_404,
+)
 from app.core.logging import get_logger
-from app.db.models import Chat, Project, ProjectFile
-from app.schemas.chat import ChatListResponse, ChatResponse
+from app.db.models import Chat, Message, Project, ProjectFile
+from app.db.session import table_version
+from app.schemas.chat import ChatListResponse
 from app.schemas.project import (
     ProjectCreate,
     ProjectFileCreate,
     ProjectFileResponse,
+    ProjectFileSummary,
     ProjectListResponse,
     ProjectResponse,
     ProjectUpdate,
@@ -23,48 +37,152 @@ from app.schemas.project import (
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Validates a whole list of ORM files in one call instead of one model per row
+_file_list_adapter = TypeAdapter(List[ProjectFileSummary])
+
+# Correlated counts selected alongside each listed project or chat
+PROJECT_CHAT_COUNT = (
+    select(func.count(Chat.id))
+    .where(Chat.project_id == Project.id)
+    .correlate(Project)
+    .scalar_subquery()
+    .label("chat_count")
+)
+PROJECT_FILE_COUNT = (
+    select(func.count(ProjectFile.id))
+    .where(ProjectFile.project_id == Project.id)
+    .correlate(Project)
+    .scalar_subquery()
+    .label("file_count")
+)
+CHAT_MESSAGE_COUNT = (
+    select(func.count(Message.id))
+    .where(Message.chat_id == Chat.id)
+    .correlate(Chat)
+    .scalar_subquery()
+    .label("message_count")
+)
+
+# Statements are cached by their lambdas' code locations, so requests skip
+# rebuilding the statement and computing its cache key
+PROJECT_COUNTS_STMT = lambda_stmt(
+    lambda: select(
+        select(func.count(Chat.id)).where(Chat.project_id == bindparam("project_id")).scalar_subquery(),
+        select(func.count(ProjectFile.id)).where(ProjectFile.project_id == bindparam("project_id")).scalar_subquery(),
+    )
+)
+
+# Recently served project list pages, keyed by (page, page_size, include_archived, with_total).
+# Entries are tied to the version of the tables they were read from, and expire after a
+# TTL so writes committed by other worker processes are picked up too
+PROJECT_LIST_CACHE_SIZE = 32
+PROJECT_LIST_CACHE_TTL = 60.0
+PROJECT_LIST_TABLES = (Project.__tablename__, Chat.__tablename__, ProjectFile.__tablename__)
+_project_list_cache: "OrderedDict[Tuple[int, int, bool, bool], Tuple[tuple, float, Dict[str, Any]]]" = OrderedDict()
+
 
-@router.get("", response_model=ProjectListResponse)
+def _get_cached_project_list(key: Tuple[int, int, bool, bool], version: tuple) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached project list page.
+
+    Args:
+        key: (page, page_size, include_archived, with_total)
+        version: Current version of the project, chat and file tables
+
+    Returns:
+        Optional[Dict[str, Any]]: Cached page payload, or None if missing, stale or expired
+    """
+    entry = _project_list_cache.get(key)
+    if entry is None or entry[0] != version or entry[1] <= time.monotonic():
+        return None
+    _project_list_cache.move_to_end(key)
+    return entry[2]
+
+
+def _cache_project_list(key: Tuple[int, int, bool, bool], version: tuple, payload: Dict[str, Any]) -> None:
+    """
+    Store a project list page, evicting the least recently used entry when full.
+
+    Args:
+        key: (page, page_size, include_archived, with_total)
+        version: Table version read before the page was queried
+        payload: Project list page payload (ProjectListResponse shape)
+    """
+    _project_list_cache[key] = (version, time.monotonic() + PROJECT_LIST_CACHE_TTL, payload)
+    _project_list_cache.move_to_end(key)
+    if len(_project_list_cache) > PROJECT_LIST_CACHE_SIZE:
+        _project_list_cache.popitem(last=False)
+
+
+@router.get("", response_model=ProjectListResponse, response_class=ORJSONResponse)
 async def list_projects(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     include_archived: bool = Query(False, description="Include archived projects"),
+    with_total: bool = Query(False, description="Also count all matching projects"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get paginated list of projects.
+    Pages are served from cache while no project, chat or file has been written.
 
     Args:
         page: Page number (1-indexed)
         page_size: Number of items per page
         include_archived: Include archived projects in results
+        with_total: Compute total and total_pages; otherwise they are null
         db: Database session
 
     Returns:
-        ProjectListResponse: Paginated list of projects
+        ORJSONResponse: Paginated list of projects (ProjectListResponse shape)
     """
     try:
-        # Build query
-        query = select(Project)
+        cache_key = (page, page_size, include_archived, with_total)
+        version = table_version(*PROJECT_LIST_TABLES)
+        cached = _get_cached_project_list(cache_key, version)
+        if cached is not None:
+            return ORJSONResponse(cached)
+
+        # Build filter conditions shared by the page and count queries
+        conditions = []
         if not include_archived:
-            query = query.where(Project.is_archived == False)
-
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        result = await db.execute(count_query)
-        total = result.scalar() or 0
-
-        # Get paginated results
-        query = query.order_by(Project.updated_at.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
-        query = query.options(selectinload(Project.chats), selectinload(Project.files))
+            conditions.append(Project.is_archived == False)
+
+        # Get paginated results with the counts computed in the same query
+        offset = (page - 1) * page_size
+        query = lambda_stmt(lambda: select(Project, PROJECT_CHAT_COUNT, PROJECT_FILE_COUNT))
+        if with_total:
+            # The window total visits every matching row, so only add it when asked
+            query += lambda s: s.add_columns(func.count().over().label("total"))
+        if not include_archived:
+            query += lambda s: s.where(Project.is_archived == False)
+        # Relationships are never needed here; fail loudly instead of lazy loading
+        query += lambda s: (
+            s.order_by(Project.updated_at.desc())
+            .offset(offset)
+            .limit(page_size)
+            .options(raiseload("*"))
+        )
 
         result = await db.execute(query)
-        projects = result.scalars().all()
+        rows = result.all()
+
+        total = total_pages = None
+        if with_total:
+            if rows:
+                total = rows[0].total
+            elif page > 1:
+                # Page is past the end, so no row carries the window total
+                count_query = select(func.count(Project.id)).where(*conditions)
+                result = await db.execute(count_query)
+                total = result.scalar() or 0
+            else:
+                total = 0
+            total_pages = (total + page_size - 1) // page_size
 
         # Add counts to each project
-        project_responses = []
-        for project in projects:
+        projects = []
+        for project, chat_count, file_count, *_ in rows:
             project_dict = {
                 "id": project.id,
                 "name": project.name,
@@ -75,20 +193,23 @@ async def list_projects(
                 "is_archived": project.is_archived,
                 "created_at": project.created_at,
                 "updated_at": project.updated_at,
-                "chat_count": len(project.chats),
-                "file_count": len(project.files),
+                "chat_count": chat_count,
+                "file_count": file_count,
             }
-            project_responses.append(ProjectResponse(**project_dict))
+            projects.append(project_dict)
 
-        total_pages = (total + page_size - 1) // page_size
+        payload = {
+            "projects": projects,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+        }
+        _cache_project_list(cache_key, version, payload)
 
-        return ProjectListResponse(
-            projects=project_responses,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-        )
+        # Serialize straight to orjson; returning a response skips response_model
+        # validation and jsonable_encoder (orjson handles UUIDs and datetimes natively)
+        return ORJSONResponse(payload)
 
     except Exception as e:
         logger.error(f"Error listing projects: {e}")
@@ -100,40 +221,31 @@ async def list_projects(
 
 @router.get("/{project_id}", response_model=ProjectWithDetails)
 async def get_project(
-    project: Project = Depends(get_project_or_404),
-    db: AsyncSession = Depends(get_db),
+    project: Project = Depends(get_project_with_details_or_404),
 ):
     """
     Get a specific project with all details including files.
 
     Args:
-        project: Project from dependency
-        db: Database session
+        project: Project with files and chats from dependency
 
     Returns:
         ProjectWithDetails: Project with files
     """
-    # Load files for the project
-    query = select(Project).where(Project.id == project.id).options(selectinload(Project.files), selectinload(Project.chats))
-    result = await db.execute(query)
-    project_with_details = result.scalar_one()
-
-    # Sort files by created_at
-    sorted_files = sorted(project_with_details.files, key=lambda f: f.created_at)
-
     return ProjectWithDetails(
-        id=project_with_details.id,
-        name=project_with_details.name,
-        custom_instructions=project_with_details.custom_instructions,
-        default_model=project_with_details.default_model,
-        temperature=project_with_details.temperature,
-        max_tokens=project_with_details.max_tokens,
-        is_archived=project_with_details.is_archived,
-        created_at=project_with_details.created_at,
-        updated_at=project_with_details.updated_at,
-        chat_count=len(project_with_details.chats),
-        file_count=len(sorted_files),
-        files=sorted_files,
+        id=project.id,
+        name=project.name,
+        custom_instructions=project.custom_instructions,
+        default_model=project.default_model,
+        temperature=project.temperature,
+        max_tokens=project.max_tokens,
+        is_archived=project.is_archived,
+        created_at=project.created_at,
+        updated_at=project.updated_at,
+        chat_count=len(project.chats),
+        file_count=len(project.files),
+        # Already ordered by created_at by the relationship's ORDER BY
+        files=_file_list_adapter.validate_python(project.files, from_attributes=True),
     )
 
 
@@ -153,16 +265,10 @@ async def create_project(
         ProjectResponse: Created project
     """
     try:
-        new_project = Project(
-            name=project_data.name,
-            custom_instructions=project_data.custom_instructions,
-            default_model=project_data.default_model,
-            temperature=project_data.temperature,
-            max_tokens=project_data.max_tokens,
-        )
-        db.add(new_project)
-        await db.flush()
-        await db.refresh(new_project)
+        # Insert and read back the generated columns in one statement
+        query = insert(Project).values(**project_data.model_dump()).returning(Project)
+        result = await db.execute(query)
+        new_project = result.scalar_one()
 
         logger.info(f"Created project {new_project.id}")
 
@@ -190,48 +296,46 @@ async def create_project(
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
 async def update_project(
+    project_id: UUID,
     project_data: ProjectUpdate,
-    project: Project = Depends(get_project_or_404),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Update a project.
 
     Args:
+        project_id: Project UUID
         project_data: Project update data
-        project: Project from dependency
         db: Database session
 
     Returns:
         ProjectResponse: Updated project
+
+    Raises:
+        HTTPException: 404 if project not found
     """
-    # Update fields
-    if project_data.name is not None:
-        project.name = project_data.name
-    if project_data.custom_instructions is not None:
-        project.custom_instructions = project_data.custom_instructions
-    if project_data.is_archived is not None:
-        project.is_archived = project_data.is_archived
-    if project_data.default_model is not None:
-        project.default_model = project_data.default_model
-    if project_data.temperature is not None:
-        project.temperature = project_data.temperature
-    if project_data.max_tokens is not None:
-        project.max_tokens = project_data.max_tokens
+    changes = project_data.model_dump(exclude_none=True)
 
-    await db.flush()
-    await db.refresh(project)
+    # Apply the changes and read back the row in one statement; no row means
+    # the project does not exist
+    if changes:
+        query = update(Project).where(Project.id == project_id).values(**changes).returning(Project)
+        result = await db.execute(query)
+        project = result.scalar_one_or_none()
+    else:
+        project = await db.get(Project, project_id)
 
-    logger.info(f"Updated project {project.id}")
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found",
+        )
 
-    # Get counts
-    chat_count_query = select(func.count()).where(Chat.project_id == project.id)
-    result = await db.execute(chat_count_query)
-    chat_count = result.scalar() or 0
+    logger.info(f"Updated project {project.id}")
 
-    file_count_query = select(func.count()).where(ProjectFile.project_id == project.id)
-    result = await db.execute(file_count_query)
-    file_count = result.scalar() or 0
+    # Get both counts in one round trip
+    result = await db.execute(PROJECT_COUNTS_STMT, {"project_id": project.id})
+    chat_count, file_count = result.one()
 
     return ProjectResponse(
         id=project.id,
@@ -267,47 +371,62 @@ async def delete_project(
     logger.info(f"Deleted project {project_id}")
 
 
-@router.get("/{project_id}/chats", response_model=ChatListResponse)
+@router.get("/{project_id}/chats", response_model=ChatListResponse, response_class=ORJSONResponse)
 async def get_project_chats(
-    project_id: str,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    project: Project = Depends(get_project_or_404),
+    with_total: bool = Query(False, description="Also count all chats in the project"),
+    project_id: UUID = Depends(get_project_id_or_404),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get all chats in a project (paginated).
 
     Args:
-        project_id: Project UUID
         page: Page number
         page_size: Items per page
-        project: Project from dependency
+        with_total: Compute total and total_pages; otherwise they are null
+        project_id: Project UUID from dependency
         db: Database session
 
     Returns:
-        ChatListResponse: Paginated list of chats
+        ORJSONResponse: Paginated list of chats (ChatListResponse shape)
     """
     try:
-        # Build query
-        query = select(Chat).where(Chat.project_id == project.id)
-
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        result = await db.execute(count_query)
-        total = result.scalar() or 0
-
-        # Get paginated results
-        query = query.order_by(Chat.updated_at.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
-        query = query.options(selectinload(Chat.messages))
+        # Get paginated results with the counts computed in the same query;
+        # the relationships' default loads are skipped since only the count is needed
+        offset = (page - 1) * page_size
+        query = lambda_stmt(lambda: select(Chat, CHAT_MESSAGE_COUNT))
+        if with_total:
+            # The window total visits every matching row, so only add it when asked
+            query += lambda s: s.add_columns(func.count().over().label("total"))
+        query += lambda s: (
+            s.where(Chat.project_id == project_id)
+            .order_by(Chat.updated_at.desc())
+            .offset(offset)
+            .limit(page_size)
+            .options(raiseload("*"))
+        )
 
         result = await db.execute(query)
-        chats = result.scalars().all()
+        rows = result.all()
+
+        total = total_pages = None
+        if with_total:
+            if rows:
+                total = rows[0].total
+            elif page > 1:
+                # Page is past the end, so no row carries the window total
+                count_query = select(func.count(Chat.id)).where(Chat.project_id == project_id)
+                result = await db.execute(count_query)
+                total = result.scalar() or 0
+            else:
+                total = 0
+            total_pages = (total + page_size - 1) // page_size
 
         # Add message count to each chat
-        chat_responses = []
-        for chat in chats:
+        chats = []
+        for chat, message_count, *_ in rows:
             chat_dict = {
                 "id": chat.id,
                 "title": chat.title,
@@ -316,18 +435,19 @@ async def get_project_chats(
                 "project_id": chat.project_id,
                 "created_at": chat.created_at,
                 "updated_at": chat.updated_at,
-                "message_count": len(chat.messages),
+                "message_count": message_count,
+            }
+            chats.append(chat_dict)
+
+        # Serialize straight to orjson, skipping response_model validation
+        return ORJSONResponse(
+            {
+                "chats": chats,
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "total_pages": total_pages,
             }
-            chat_responses.append(ChatResponse(**chat_dict))
-
-        total_pages = (total + page_size - 1) // page_size
-
-        return ChatListResponse(
-            chats=chat_responses,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
         )
 
     except Exception as e:
@@ -341,7 +461,7 @@ async def get_project_chats(
 @router.post("/{project_id}/files", response_model=ProjectFileResponse, status_code=status.HTTP_201_CREATED)
 async def upload_file(
     file_data: ProjectFileCreate,
-    project: Project = Depends(get_project_or_404),
+    project_id: UUID = Depends(get_project_id_or_404),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -349,40 +469,45 @@ async def upload_file(
 
     Args:
         file_data: File upload data
-        project: Project from dependency
+        project_id: Project UUID from dependency
         db: Database session
 
     Returns:
         ProjectFileResponse: Created file
     """
     try:
-        # Generate content preview (first 200 chars)
-        content_preview = file_data.content[:200] if len(file_data.content) > 200 else file_data.content
-
-        # Create file record
-        new_file = ProjectFile(
-            project_id=project.id,
+        # Create file record and read back the derived columns in one statement;
+        # the database computes file_size and content_preview from the single
+        # content parameter, so the body is sent once
+        content = bindparam("content", file_data.content, type_=Text)
+        query = insert(ProjectFile).values(
+            project_id=project_id,
             filename=file_data.filename,
-            file_path=f"project_{project.id}/{file_data.filename}",  # Virtual path
+            file_path=f"project_{project_id}/{file_data.filename}",  # Virtual path
             file_type=file_data.file_type,
-            file_size=len(file_data.content),
-            content_preview=content_preview,
-            content=file_data.content,
+            file_size=func.length(content),
+            content_preview=func.substr(content, 1, 200),
+            content=content,
+        ).returning(
+            # Only what the client does not already have; content is not sent back
+            ProjectFile.id,
+            ProjectFile.file_size,
+            ProjectFile.content_preview,
+            ProjectFile.created_at,
         )
-        db.add(new_file)
-        await db.flush()
-        await db.refresh(new_file)
+        result = await db.execute(query)
+        new_file = result.one()
 
-        logger.info(f"Uploaded file {new_file.id} to project {project.id}")
+        logger.info(f"Uploaded file {new_file.id} to project {project_id}")
 
         return ProjectFileResponse(
             id=new_file.id,
-            project_id=new_file.project_id,
-            filename=new_file.filename,
-            file_type=new_file.file_type,
+            project_id=project_id,
+            filename=file_data.filename,
+            file_type=file_data.file_type,
             file_size=new_file.file_size,
             content_preview=new_file.content_preview,
-            content=new_file.content,
+            content=file_data.content,
             created_at=new_file.created_at,
         )
 
@@ -394,10 +519,14 @@ async def upload_file(
         )
 
 
-@router.get("/{project_id}/files/{file_id}", response_model=ProjectFileResponse)
+@router.get(
+    "/{project_id}/files/{file_id}",
+    response_model=Union[ProjectFileResponse, ProjectFileSummary],
+)
 async def get_file(
-    file_id: str,
-    project: Project = Depends(get_project_or_404),
+    file_id: UUID,
+    include_content: bool = Query(True, description="Include the full file content"),
+    project_id: UUID = Depends(get_project_id_or_404),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -405,18 +534,24 @@ async def get_file(
 
     Args:
         file_id: File UUID
-        project: Project from dependency
+        include_content: Include the full file content; when False the content is not read
+        project_id: Project UUID from dependency
         db: Database session
 
     Returns:
-        ProjectFileResponse: File details with content
+        Union[ProjectFileResponse, ProjectFileSummary]: File details, with content if requested
+
+    Raises:
+        HTTPException: 404 if file not found
     """
     try:
-        # Query for the file
+        # Query for the file; the deferred content is only read when it will be returned
         query = select(ProjectFile).where(
             ProjectFile.id == file_id,
-            ProjectFile.project_id == project.id,
-        )
+            ProjectFile.project_id == project_id,
+        ).options(raiseload("*"))
+        if include_content:
+            query = query.options(undefer(ProjectFile.content))
         result = await db.execute(query)
         file = result.scalar_one_or_none()
 
@@ -426,16 +561,18 @@ async def get_file(
                 detail="File not found",
             )
 
-        return ProjectFileResponse(
-            id=file.id,
-            project_id=file.project_id,
-            filename=file.filename,
-            file_type=file.file_type,
-            file_size=file.file_size,
-            content_preview=file.content_preview,
-            content=file.content,
-            created_at=file.created_at,
-        )
+        summary = {
+            "id": file.id,
+            "project_id": file.project_id,
+            "filename": file.filename,
+            "file_type": file.file_type,
+            "file_size": file.file_size,
+            "content_preview": file.content_preview,
+            "created_at": file.created_at,
+        }
+        if not include_content:
+            return ProjectFileSummary(**summary)
+        return ProjectFileResponse(**summary, content=file.content)
 
     except HTTPException:
         raise
@@ -449,8 +586,8 @@ async def get_file(
 
 @router.delete("/{project_id}/files/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_file(
-    file_id: str,
-    project: Project = Depends(get_project_or_404),
+    file_id: UUID,
+    project_id: UUID = Depends(get_project_id_or_404),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -458,28 +595,27 @@ async def delete_file(
 
     Args:
         file_id: File UUID
-        project: Project from dependency
+        project_id: Project UUID from dependency
         db: Database session
+
+    Raises:
+        HTTPException: 404 if file not found
     """
     try:
-        # Query for the file
-        query = select(ProjectFile).where(
+        # Delete the file; message links are removed by ON DELETE CASCADE
+        query = delete(ProjectFile).where(
             ProjectFile.id == file_id,
-            ProjectFile.project_id == project.id,
-        )
+            ProjectFile.project_id == project_id,
+        ).returning(ProjectFile.id)
         result = await db.execute(query)
-        file = result.scalar_one_or_none()
 
-        if not file:
+        if result.scalar_one_or_none() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="File not found",
             )
 
-        await db.delete(file)
-        await db.flush()
-
-        logger.info(f"Deleted file {file_id} from project {project.id}")
+        logger.info(f"Deleted file {file_id} from project {project_id}")
 
     except HTTPException:
         raise
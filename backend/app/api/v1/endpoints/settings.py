@@ -1,14 +1,19 @@
 """
 API endpoints for settings management.
 """
+from typing import Any, Dict, Optional, Type, Union
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from app.api.deps import get_chat_or_404, get_db
+from app.core.cache import TTLCache
 from app.core.config import settings as app_settings
 from app.core.logging import get_logger
 from app.db.models import Chat, ChatSettings, Settings
+from app.schemas.base import orm_to_schema
 from app.schemas.settings import (
     ChatSettingsResponse,
     ChatSettingsUpdate,
@@ -19,6 +24,70 @@ from app.schemas.settings import (
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Global settings rarely change, so GET serves them from memory between PATCHes
+_global_settings_cache: TTLCache[SettingsResponse] = TTLCache(app_settings.global_settings_cache_ttl)
+
+
+def _default_settings(**overrides) -> Dict[str, Any]:
+    """
+    Build the default global settings row, using config.py as source of truth.
+
+    Args:
+        **overrides: Field values to use instead of the defaults
+
+    Returns:
+        Dict[str, Any]: Column values for the settings row
+    """
+    values = {
+        "id": 1,
+        "default_model": app_settings.default_model,
+        "conversation_summarization_model": app_settings.title_generation_model,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2048,
+        "num_ctx": 2048,
+        "theme": "dark",
+    }
+    values.update(overrides)
+    return values
+
+
+async def _upsert(
+    db: AsyncSession,
+    model: Type[Union[Settings, ChatSettings]],
+    key: InstrumentedAttribute,
+    values: Dict[str, Any],
+    changes: Optional[Dict[str, Any]] = None,
+) -> Union[Settings, ChatSettings]:
+    """
+    Insert a settings row, or apply changes to the existing one, in one statement.
+
+    Args:
+        db: Database session
+        model: Settings model to write
+        key: Primary key column used as the conflict target
+        values: Column values for a new row, including the key
+        changes: Fields to overwrite when the row already exists
+
+    Returns:
+        Union[Settings, ChatSettings]: The inserted or updated row
+    """
+    query = pg_insert(model).values(**values)
+    if changes:
+        # onupdate defaults don't fire for ON CONFLICT, so take the new row's timestamp
+        query = query.on_conflict_do_update(
+            index_elements=[key],
+            set_={field: query.excluded[field] for field in (*changes, "updated_at")},
+        )
+    else:
+        query = query.on_conflict_do_nothing(index_elements=[key])
+
+    result = await db.execute(query.returning(model))
+    row = result.scalar_one_or_none()
+    if row is None:
+        # Nothing to change and the row already existed
+        row = await db.get(model, values[key.key])
+    return row
+
 
 @router.get("/settings", response_model=SettingsResponse)
 async def get_global_settings(
@@ -26,6 +95,7 @@ async def get_global_settings(
 ):
     """
     Get global application settings.
+    The row is cached in-process for global_settings_cache_ttl seconds.
 
     Args:
         db: Database session
@@ -36,28 +106,27 @@ async def get_global_settings(
     Raises:
         HTTPException: If settings not found
     """
+    cached = _global_settings_cache.get()
+    if cached is not None:
+        return cached
+
     try:
-        query = select(Settings).where(Settings.id == 1)
-        result = await db.execute(query)
-        settings = result.scalar_one_or_none()
-
-        if not settings:
-            # Create default settings if not exists, using config.py as source of truth
-            settings = Settings(
-                id=1,
-                default_model=app_settings.default_model,
-                conversation_summarization_model=app_settings.title_generation_model,
-                default_temperature=0.7,
-                default_max_tokens=2048,
-                num_ctx=2048,
-                theme="dark",
-            )
-            db.add(settings)
-            await db.flush()
-            await db.refresh(settings)
-            logger.info(f"Created default settings with model: {app_settings.default_model}")
-
-        return SettingsResponse.model_validate(settings)
+        async with _global_settings_cache.lock:
+            # Another request may have loaded the settings while this one waited
+            cached = _global_settings_cache.get()
+            if cached is not None:
+                return cached
+
+            settings = await db.get(Settings, 1)
+
+            if not settings:
+                # Create default settings if not exists, using config.py as source of truth
+                settings = await _upsert(db, Settings, Settings.id, _default_settings())
+                logger.info(f"Created default settings with model: {app_settings.default_model}")
+
+            response = orm_to_schema(SettingsResponse, settings)
+            _global_settings_cache.set(response)
+            return response
 
     except Exception as e:
         logger.error(f"Error retrieving settings: {e}")
@@ -83,42 +152,26 @@ async def update_global_settings(
         SettingsResponse: Updated settings
     """
     try:
-        query = select(Settings).where(Settings.id == 1)
-        result = await db.execute(query)
-        settings = result.scalar_one_or_none()
-
-        if not settings:
-            settings = Settings(
-                id=1,
-                default_model=app_settings.default_model,
-                conversation_summarization_model=app_settings.title_generation_model,
-                default_temperature=0.7,
-                default_max_tokens=2048,
-                num_ctx=2048,
-                theme="dark",
-            )
-            db.add(settings)
-
-        # Update fields
-        if settings_data.default_model is not None:
-            settings.default_model = settings_data.default_model
-        if settings_data.conversation_summarization_model is not None:
-            settings.conversation_summarization_model = settings_data.conversation_summarization_model
-        if settings_data.default_temperature is not None:
-            settings.default_temperature = settings_data.default_temperature
-        if settings_data.default_max_tokens is not None:
-            settings.default_max_tokens = settings_data.default_max_tokens
-        if settings_data.num_ctx is not None:
-            settings.num_ctx = settings_data.num_ctx
-        if settings_data.theme is not None:
-            settings.theme = settings_data.theme
-
-        await db.flush()
-        await db.refresh(settings)
+        # Every global setting is required, so an explicit null leaves the field unchanged
+        changes = {
+            field: value
+            for field, value in settings_data.model_dump(exclude_unset=True).items()
+            if value is not None
+        }
+
+        # Apply the changes, creating the row from the defaults if needed, in one statement
+        settings = await _upsert(db, Settings, Settings.id, _default_settings(**changes), changes)
+        response = orm_to_schema(SettingsResponse, settings)
+
+        # Commit before caching, so a concurrent GET can't cache the old row after
+        # this update; the lock makes the new value win over any GET in flight
+        await db.commit()
+        async with _global_settings_cache.lock:
+            _global_settings_cache.set(response)
 
         logger.info("Updated global settings")
 
-        return SettingsResponse.model_validate(settings)
+        return response
 
     except Exception as e:
         logger.error(f"Error updating settings: {e}")
@@ -144,19 +197,14 @@ async def get_chat_settings(
         ChatSettingsResponse: Chat-specific settings
     """
     # Get or create chat settings
-    settings_query = select(ChatSettings).where(ChatSettings.chat_id == chat.id)
-    result = await db.execute(settings_query)
-    chat_settings = result.scalar_one_or_none()
+    chat_settings = await db.get(ChatSettings, chat.id)
 
     if not chat_settings:
         # Return empty chat settings
-        chat_settings = ChatSettings(chat_id=chat.id)
-        db.add(chat_settings)
-        await db.flush()
-        await db.refresh(chat_settings)
+        chat_settings = await _upsert(db, ChatSettings, ChatSettings.chat_id, {"chat_id": chat.id})
         logger.info(f"Created chat settings for chat {chat.id}")
 
-    return ChatSettingsResponse.model_validate(chat_settings)
+    return orm_to_schema(ChatSettingsResponse, chat_settings)
 
 
 @router.patch("/{chat_id}/settings", response_model=ChatSettingsResponse)
@@ -167,6 +215,8 @@ async def update_chat_settings(
 ):
     """
     Update settings for a specific chat.
+    Only fields present in the request are changed; an explicit null clears the
+    override so the chat falls back to the project or global value.
 
     Args:
         settings_data: Chat settings update data
@@ -176,26 +226,13 @@ async def update_chat_settings(
     Returns:
         ChatSettingsResponse: Updated chat settings
     """
-    # Get or create chat settings
-    settings_query = select(ChatSettings).where(ChatSettings.chat_id == chat.id)
-    result = await db.execute(settings_query)
-    chat_settings = result.scalar_one_or_none()
-
-    if not chat_settings:
-        chat_settings = ChatSettings(chat_id=chat.id)
-        db.add(chat_settings)
-
-    # Update fields
-    if settings_data.temperature is not None:
-        chat_settings.temperature = settings_data.temperature
-    if settings_data.max_tokens is not None:
-        chat_settings.max_tokens = settings_data.max_tokens
-    if settings_data.system_prompt is not None:
-        chat_settings.system_prompt = settings_data.system_prompt
+    changes = settings_data.model_dump(exclude_unset=True)
 
-    await db.flush()
-    await db.refresh(chat_settings)
+    # Apply the changes, creating the row if needed, in one statement
+    chat_settings = await _upsert(
+        db, ChatSettings, ChatSettings.chat_id, {"chat_id": chat.id, **changes}, changes
+    )
 
     logger.info(f"Updated chat settings for chat {chat.id}")
 
-    return ChatSettingsResponse.model_validate(chat_settings)
+    return orm_to_schema(ChatSettingsResponse, chat_settings)
@@ -0,0 +1,51 @@
+"""
+Process-local caching helpers.
+"""
+import asyncio
+import time
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """
+    Single-value cache that expires a fixed number of seconds after it is set.
+
+    Each worker process holds its own copy, so a value changed through another
+    worker is only picked up once the TTL runs out.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl: Seconds a stored value stays valid
+        """
+        self.ttl = ttl
+        self._value: Optional[T] = None
+        self._expires_at = 0.0
+        # Serializes misses so concurrent requests load the value only once
+        self.lock = asyncio.Lock()
+
+    def get(self) -> Optional[T]:
+        """
+        Get the cached value.
+
+        Returns:
+            Optional[T]: The value, or None if nothing is stored or it has expired
+        """
+        if time.monotonic() >= self._expires_at:
+            return None
+        return self._value
+
+    def set(self, value: T) -> None:
+        """
+        Store a value for the next ttl seconds.
+
+        Args:
+            value: Value to cache
+        """
+        self._value = value
+        self._expires_at = time.monotonic() + self.ttl
@@ -2,7 +2,8 @@
 Application configuration using Pydantic Settings.
 Loads configuration from environment variables.
 """
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,6 +17,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # Application Settings
@@ -33,6 +35,14 @@ class Settings(BaseSettings):
     postgres_host: str = Field(default="localhost", description="PostgreSQL host")
     postgres_port: int = Field(default=5432, description="PostgreSQL port")
     postgres_db: str = Field(default="ollama_chat", description="PostgreSQL database name")
+    db_pool_size: int = Field(default=20, ge=1, description="Persistent connections kept in the pool")
+    db_max_overflow: int = Field(default=10, ge=0, description="Extra connections allowed beyond the pool size")
+    db_pool_timeout: float = Field(default=30.0, gt=0, description="Seconds to wait for a free pooled connection")
+    db_pool_recycle: int = Field(default=1800, description="Seconds after which pooled connections are replaced (-1 disables)")
+    db_pgbouncer: bool = Field(
+        default=False,
+        description="Connect through PgBouncer in transaction mode (disables prepared statement caching)",
+    )
 
     # Ollama Settings
     ollama_base_url: str = Field(
@@ -43,6 +53,11 @@ class Settings(BaseSettings):
         default="qwen2.5-coder:7b-instruct-q6_K",
         description="Default Ollama model to use",
     )
+    ollama_health_interval: float = Field(
+        default=15.0,
+        gt=0,
+        description="Seconds between background Ollama health checks",
+    )
 
     # Title Generation Settings
     title_generation_model: str = Field(
@@ -58,9 +73,23 @@ class Settings(BaseSettings):
         description="Enable automatic chat title generation",
     )
 
+    # Streaming Settings
+    max_concurrent_streams: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of chat responses streamed from Ollama at once",
+    )
+
+    # Cache Settings
+    global_settings_cache_ttl: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds the global settings row is cached in each worker",
+    )
+
     # CORS Settings
-    cors_origins: Union[List[str], str] = Field(
-        default=["http://localhost:5173", "http://localhost:3000"],
+    cors_origins: Union[Tuple[str, ...], str] = Field(
+        default=("http://localhost:5173", "http://localhost:3000"),
         description="Allowed CORS origins (comma-separated string or list)",
     )
 
@@ -100,10 +129,10 @@ class Settings(BaseSettings):
     @field_validator("cors_origins", mode="after")
     @classmethod
     def parse_cors_origins(cls, v):
-        """Parse CORS origins from comma-separated string or list."""
+        """Parse CORS origins from comma-separated string or list into a tuple."""
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
-        return v if isinstance(v, list) else [v]
+            return tuple(origin.strip() for origin in v.split(",") if origin.strip())
+        return tuple(v)
 
     @field_validator("log_level")
     @classmethod
@@ -116,5 +145,16 @@ class Settings(BaseSettings):
         return v_lower
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, reading the environment only on first call.
+
+    Returns:
+        Settings: Shared, immutable settings instance
+    """
+    return Settings()
+
+
 # Create global settings instance
-settings = Settings()
+settings = get_settings()
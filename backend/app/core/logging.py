@@ -3,13 +3,18 @@ Logging configuration for the application.
 Uses structured JSON logging for production and colored console logging for development.
 """
 import logging
+import queue
 import sys
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
-from pythonjsonlogger import jsonlogger
+import orjson
 
 from app.core.config import settings
 
+# Writes log records to the console from a background thread
+_queue_listener: Optional[QueueListener] = None
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output."""
@@ -22,25 +27,41 @@ class ColoredFormatter(logging.Formatter):
     reset = "\x1b[0m"
 
     FORMATS = {
-        logging.DEBUG: grey + "%(asctime)s %(levelname)s" + reset + " - %(message)s",
-        logging.INFO: blue + "%(asctime)s %(levelname)s" + reset + " - %(message)s",
-        logging.WARNING: yellow + "%(asctime)s %(levelname)s" + reset + " - %(message)s",
-        logging.ERROR: red + "%(asctime)s %(levelname)s" + reset + " - %(message)s",
-        logging.CRITICAL: bold_red + "%(asctime)s %(levelname)s" + reset + " - %(message)s",
+        logging.DEBUG: grey + "%(asctime)s.%(msecs)03d %(levelname)s" + reset + " - %(message)s",
+        logging.INFO: blue + "%(asctime)s.%(msecs)03d %(levelname)s" + reset + " - %(message)s",
+        logging.WARNING: yellow + "%(asctime)s.%(msecs)03d %(levelname)s" + reset + " - %(message)s",
+        logging.ERROR: red + "%(asctime)s.%(msecs)03d %(levelname)s" + reset + " - %(message)s",
+        logging.CRITICAL: bold_red + "%(asctime)s.%(msecs)03d %(levelname)s" + reset + " - %(message)s",
+    }
+
+    # One formatter per level, built once instead of per record
+    FORMATTERS = {
+        level: logging.Formatter(fmt, datefmt="%Y-%m-%d %H:%M:%S")
+        for level, fmt in FORMATS.items()
     }
 
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt, datefmt="%Y-%m-%d %H:%M:%S")
-        # Add milliseconds manually
-        result = formatter.format(record)
-        # Insert milliseconds after the seconds
-        import datetime
-        dt = datetime.datetime.fromtimestamp(record.created)
-        ms = f".{int((record.created % 1) * 1000):03d}"
-        # Replace first occurrence of time format with time+ms
-        result = result.replace(dt.strftime("%H:%M:%S"), dt.strftime("%H:%M:%S") + ms, 1)
-        return result
+        formatter = self.FORMATTERS.get(record.levelno, self.FORMATTERS[logging.INFO])
+        return formatter.format(record)
+
+
+class JSONFormatter(logging.Formatter):
+    """Formatter that renders each record as a single JSON object using orjson."""
+
+    def __init__(self):
+        super().__init__(datefmt="%Y-%m-%d %H:%M:%S")
+
+    def format(self, record):
+        entry = {
+            "asctime": self.formatTime(record, self.datefmt),
+            "name": record.name,
+            "levelname": record.levelname,
+            "message": record.getMessage(),
+        }
+        # Set when the record is formatted without going through the queue handler
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
 
 
 def setup_logging() -> None:
@@ -54,8 +75,9 @@ def setup_logging() -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
-    # Remove existing handlers
+    # Remove existing handlers and stop a listener from an earlier setup
     root_logger.handlers.clear()
+    stop_logging()
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -65,13 +87,17 @@ def setup_logging() -> None:
     if settings.debug:
         formatter = ColoredFormatter()
     else:
-        formatter = jsonlogger.JsonFormatter(
-            "%(asctime)s %(name)s %(levelname)s %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
+        formatter = JSONFormatter()
 
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+
+    # Loggers only enqueue records; the listener thread does the formatting and
+    # console writes, so request handlers never block on stdout
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _queue_listener.start()
 
     # Set logging levels for third-party libraries
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -79,6 +105,16 @@ def setup_logging() -> None:
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 
+def stop_logging() -> None:
+    """
+    Stop the background log listener after writing out any queued records.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the given name."""
     return logging.getLogger(name)
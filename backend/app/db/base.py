@@ -14,17 +14,36 @@ class Base(DeclarativeBase):
     pass
 
 
+def _utcnow() -> datetime:
+    """Current time in UTC."""
+    return datetime.now(timezone.utc)
+
+
+def _created_at_or_utcnow(context: Any) -> datetime:
+    """
+    Default updated_at to the row's created_at, so an INSERT reads the clock once
+    and both timestamps are identical.
+
+    Args:
+        context: SQLAlchemy execution context for the row being inserted
+
+    Returns:
+        datetime: The row's created_at, or the current UTC time if it is not set
+    """
+    return context.get_current_parameters().get("created_at") or _utcnow()
+
+
 class TimestampMixin:
     """Mixin to add created_at and updated_at timestamps."""
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        default=_utcnow,
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=_created_at_or_utcnow,
+        onupdate=_utcnow,
         nullable=False,
     )
@@ -4,7 +4,7 @@ Database models for chats and messages.
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Table, Text
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, Table, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,6 +17,7 @@ message_files = Table(
     Base.metadata,
     Column("message_id", UUID(as_uuid=True), ForeignKey("messages.id", ondelete="CASCADE"), primary_key=True, nullable=False),
     Column("file_id", UUID(as_uuid=True), ForeignKey("project_files.id", ondelete="CASCADE"), primary_key=True, nullable=False),
+    Index("ix_message_files_file_id", "file_id"),
 )
 
 
@@ -40,11 +41,15 @@ class Chat(Base, TimestampMixin):
     )
 
     # Relationships
+    # Message history is never loaded implicitly; endpoints that read it request a
+    # selectinload, and deletes are cascaded by the database
     messages: Mapped[List["Message"]] = relationship(
         "Message",
         back_populates="chat",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+        order_by="Message.created_at",
     )
     settings: Mapped[Optional["ChatSettings"]] = relationship(
         "ChatSettings",
@@ -57,6 +62,25 @@ class Chat(Base, TimestampMixin):
         back_populates="chats",
     )
 
+    __table_args__ = (
+        Index(
+            "ix_chats_project_archived_updated",
+            "project_id",
+            "is_archived",
+            text("updated_at DESC"),
+        ),
+        Index(
+            "ix_chats_project_updated",
+            "project_id",
+            text("updated_at DESC"),
+        ),
+        Index(
+            "ix_chats_active_updated_at",
+            text("updated_at DESC"),
+            postgresql_where=text("is_archived = false"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Chat(id={self.id}, title={self.title}, model={self.model})>"
 
@@ -88,5 +112,16 @@ class Message(Base, TimestampMixin):
         lazy="selectin",
     )
 
+    __table_args__ = (
+        Index("ix_messages_chat_id_created_at", "chat_id", "created_at"),
+        Index("ix_messages_chat_id_role_created_at", "chat_id", "role", "created_at"),
+        Index(
+            "brin_messages_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Message(id={self.id}, role={self.role}, chat_id={self.chat_id})>"
@@ -4,7 +4,7 @@ Database models for projects and project files.
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import Boolean, CheckConstraint, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, CheckConstraint, Float, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -31,20 +31,27 @@ class Project(Base, TimestampMixin):
     max_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Relationships
+    # Not part of any response, so they are never loaded implicitly; endpoints that
+    # need them request a selectinload, and deletes are cascaded by the database
     chats: Mapped[List["Chat"]] = relationship(
         "Chat",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     files: Mapped[List["ProjectFile"]] = relationship(
         "ProjectFile",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+        order_by="ProjectFile.created_at",
     )
 
     __table_args__ = (
+        # Project listing filtered by archive status, newest first
+        Index("ix_projects_archived_updated", "is_archived", text("updated_at DESC")),
         CheckConstraint(
             "temperature IS NULL OR (temperature >= 0.0 AND temperature <= 2.0)",
             name="valid_project_temperature",
@@ -79,10 +86,16 @@ class ProjectFile(Base, TimestampMixin):
     file_type: Mapped[str] = mapped_column(String(20), nullable=False)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)
     content_preview: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Full file bodies are only read when a single file is requested
+    content: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
 
     # Relationships
     project: Mapped["Project"] = relationship("Project", back_populates="files")
 
+    __table_args__ = (
+        # Project file listing and prompt context, oldest first
+        Index("ix_project_files_project_id_created_at", "project_id", "created_at"),
+    )
+
     def __repr__(self) -> str:
         return f"<ProjectFile(id={self.id}, filename={self.filename}, project_id={self.project_id})>"
@@ -1,19 +1,34 @@
 """
 Database session management with async SQLAlchemy.
 """
-from typing import AsyncGenerator
+import asyncio
+from collections import Counter
+from typing import AsyncGenerator, Tuple
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
 
+# PgBouncer in transaction mode may run each statement on a different server
+# connection, so prepared statements cannot be cached per connection
+_connect_args = {}
+if settings.db_pgbouncer:
+    _connect_args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
     pool_pre_ping=True,
+    connect_args=_connect_args,
+    # Room for every statement variant the API builds (default is 500)
+    query_cache_size=1200,
 )
 
 # Create async session factory
@@ -26,6 +41,98 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Committed write count per table in this process; "*" counts writes to unknown tables
+_table_versions: Counter = Counter()
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session, flush_context) -> None:
+    """Record that the session has written to the database, and to which tables."""
+    session.info["has_writes"] = True
+    # new/dirty/deleted still hold the pre-flush state here
+    tables = session.info.setdefault("written_tables", set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        tables.add(obj.__table__.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(orm_execute_state) -> None:
+    """Record that the session has executed a non-SELECT statement, and on which table."""
+    if not orm_execute_state.is_select:
+        session = orm_execute_state.session
+        session.info["has_writes"] = True
+        table = getattr(orm_execute_state.statement, "table", None)
+        session.info.setdefault("written_tables", set()).add(getattr(table, "name", "*"))
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_table_versions(session) -> None:
+    """Count the committed writes so readers can tell their cached data is stale."""
+    _table_versions.update(session.info.get("written_tables", ()))
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_writes(session) -> None:
+    """Reset the write markers once the transaction has ended."""
+    session.info.pop("has_writes", None)
+    session.info.pop("written_tables", None)
+
+
+def table_version(*tables: str) -> Tuple[int, ...]:
+    """
+    Get a version for a set of tables that changes whenever this process
+    commits a write to any of them.
+    Read it before querying, so a write committed meanwhile makes the result stale.
+
+    Args:
+        *tables: Table names
+
+    Returns:
+        Tuple[int, ...]: Committed write counts for the tables and for unknown tables
+    """
+    return tuple(_table_versions[table] for table in (*tables, "*"))
+
+
+def has_pending_writes(session: AsyncSession) -> bool:
+    """
+    Check whether a session has changes that need to be committed.
+
+    Args:
+        session: Database session
+
+    Returns:
+        bool: True if the session has unflushed or flushed-but-uncommitted writes
+    """
+    return bool(
+        session.new
+        or session.dirty
+        or session.deleted
+        or session.info.get("has_writes")
+    )
+
+
+async def warm_pool() -> None:
+    """
+    Open the pool's persistent connections up front so the first requests
+    don't pay connection setup.
+
+    Raises:
+        Exception: If any connection could not be opened
+    """
+    # Check out every connection at once so each one is distinct, then return them all
+    connections = await asyncio.gather(
+        *(engine.connect().start() for _ in range(settings.db_pool_size)),
+        return_exceptions=True,
+    )
+    opened = [conn for conn in connections if not isinstance(conn, BaseException)]
+    await asyncio.gather(*(conn.close() for conn in opened))
+
+    for conn in connections:
+        if isinstance(conn, BaseException):
+            raise conn
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function to get database session.
@@ -36,7 +143,8 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if has_pending_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -1,17 +1,19 @@
 """
 Main FastAPI application entry point.
 """
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
+from app.api.v1.endpoints.models import ollama_health_loop, refresh_ollama_status
 from app.api.v1.router import api_router
 from app.core.config import settings
-from app.core.logging import get_logger, setup_logging
+from app.core.logging import get_logger, setup_logging, stop_logging
 from app.db.base import Base
-from app.db.session import engine
+from app.db.session import engine, warm_pool
 from app.services.ollama_service import ollama_service
 from app.utils.exceptions import (
     ChatNotFoundException,
@@ -24,6 +26,26 @@ setup_logging()
 logger = get_logger(__name__)
 
 
+def check_unique_routes(app: FastAPI) -> None:
+    """
+    Ensure no route is registered twice for the same method and path.
+    A router included twice would double the routes walked on every dispatch.
+
+    Args:
+        app: FastAPI application
+
+    Raises:
+        RuntimeError: If a method and path pair is registered more than once
+    """
+    seen = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or {"*"}:
+            key = (method, route.path)
+            if key in seen:
+                raise RuntimeError(f"Duplicate route registered: {method} {route.path}")
+            seen.add(key)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -35,6 +57,8 @@ async def lifespan(app: FastAPI):
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"Ollama URL: {settings.ollama_base_url}")
 
+    check_unique_routes(app)
+
     # Initialize database tables
     try:
         async with engine.begin() as conn:
@@ -44,19 +68,33 @@ async def lifespan(app: FastAPI):
         logger.error(f"✗ Failed to initialize database: {e}")
         raise
 
-    # Check Ollama connection
+    # Pre-warm the connection pool
     try:
-        await ollama_service.check_health()
-        models = await ollama_service.get_models()
-        logger.info(f"✓ Connected to Ollama ({len(models)} models available)")
-    except OllamaConnectionError as e:
-        logger.warning(f"⚠ Ollama not available: {e}")
+        await warm_pool()
+        logger.info(f"✓ Database pool warmed ({settings.db_pool_size} connections)")
+    except Exception as e:
+        logger.warning(f"⚠ Failed to warm database pool: {e}")
+
+    # Check Ollama connection; this also seeds the status served by /ollama/status
+    ollama_status = await refresh_ollama_status()
+    if ollama_status.connected:
+        logger.info(f"✓ Connected to Ollama ({ollama_status.models_count} models available)")
+    else:
+        logger.warning(f"⚠ Ollama not available: {ollama_status.error}")
         logger.warning("Application will start but chat functionality may not work")
 
+    # Keep the Ollama status fresh in the background
+    health_task = asyncio.create_task(ollama_health_loop())
+
     yield
 
     # Shutdown
     logger.info(f"Shutting down {settings.app_name}")
+    health_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await health_task
+    await ollama_service.aclose()
+    stop_logging()
 
 
 # Create FastAPI application
@@ -66,6 +104,7 @@ app = FastAPI(
     version="1.0.0",
     debug=settings.debug,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
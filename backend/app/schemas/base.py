@@ -0,0 +1,28 @@
+"""
+Helpers shared by the Pydantic schemas.
+"""
+from typing import Any, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+def orm_to_schema(model_cls: Type[SchemaT], orm_obj: Any) -> SchemaT:
+    """
+    Build a response schema from a loaded ORM row without validation.
+    The row was already constrained by the database, so the mapped column
+    values are copied as-is; every column must be loaded.
+
+    Args:
+        model_cls: Pydantic schema class to build
+        orm_obj: SQLAlchemy model instance
+
+    Returns:
+        SchemaT: Schema instance holding the row's column values
+    """
+    mapper = inspect(orm_obj).mapper
+    return model_cls.model_construct(
+        **{attr.key: getattr(orm_obj, attr.key) for attr in mapper.column_attrs}
+    )
@@ -54,10 +54,10 @@ class ChatListResponse(BaseModel):
     """Schema for paginated chat list response."""
 
     chats: List[ChatResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Total number of items (null when the count was skipped)")
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = Field(None, description="Total number of pages (null when the count was skipped)")
 
 
 # Forward reference resolution
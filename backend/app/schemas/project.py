@@ -43,8 +43,8 @@ class ProjectUpdate(BaseModel):
     max_tokens: Optional[int] = Field(None, gt=0)
 
 
-class ProjectFileResponse(BaseModel):
-    """Schema for project file response."""
+class ProjectFileSummary(BaseModel):
+    """Schema for project file listing, without the file content."""
 
     id: UUID
     project_id: UUID
@@ -52,12 +52,17 @@ class ProjectFileResponse(BaseModel):
     file_type: str
     file_size: int
     content_preview: Optional[str]
-    content: Optional[str]
     created_at: datetime
 
     model_config = {"from_attributes": True}
 
 
+class ProjectFileResponse(ProjectFileSummary):
+    """Schema for project file response."""
+
+    content: Optional[str]
+
+
 class ProjectFileCreate(BaseModel):
     """Schema for creating a new project file."""
 
@@ -82,14 +87,14 @@ class ProjectResponse(ProjectBase):
 class ProjectWithDetails(ProjectResponse):
     """Schema for project with detailed information including files."""
 
-    files: List[ProjectFileResponse] = Field(default_factory=list)
+    files: List[ProjectFileSummary] = Field(default_factory=list)
 
 
 class ProjectListResponse(BaseModel):
     """Schema for paginated project list response."""
 
     projects: List[ProjectResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Total number of items (null when the count was skipped)")
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = Field(None, description="Total number of pages (null when the count was skipped)")
@@ -1,9 +1,11 @@
 """
 Service for interacting with Ollama API.
 """
+import asyncio
 import json
+import time
 from pathlib import Path
-from typing import AsyncGenerator, Dict, List, Optional
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
 
 import httpx
 import ollama
@@ -15,6 +17,9 @@ from app.utils.exceptions import OllamaConnectionError, OllamaModelNotFoundError
 
 logger = get_logger(__name__)
 
+# How long a fetched model list is reused before asking Ollama again
+MODELS_CACHE_TTL = 5.0
+
 
 class OllamaService:
     """Service for managing Ollama API interactions."""
@@ -23,8 +28,20 @@ class OllamaService:
         """Initialize Ollama service with base URL from settings."""
         self.base_url = settings.ollama_base_url
         self.client = AsyncClient(host=self.base_url)
+        # Shared keep-alive client for direct HTTP calls, closed via aclose() on shutdown
+        self.http_client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        self._models_cache: Optional[Tuple[float, List[Dict]]] = None
+        self._models_inflight: Optional["asyncio.Future[List[Dict]]"] = None
         logger.info(f"OllamaService initialized with base URL: {self.base_url}")
 
+    async def aclose(self) -> None:
+        """Close the shared HTTP client's pooled connections."""
+        await self.http_client.aclose()
+
     async def check_health(self) -> bool:
         """
         Check if Ollama is accessible.
@@ -36,14 +53,10 @@ class OllamaService:
             OllamaConnectionError: If unable to connect
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/api/tags",
-                    timeout=5.0,
-                )
-                response.raise_for_status()
-                logger.info("Ollama health check passed")
-                return True
+            response = await self.http_client.get("/api/tags")
+            response.raise_for_status()
+            logger.info("Ollama health check passed")
+            return True
         except httpx.RequestError as e:
             logger.error(f"Ollama connection error: {e}")
             raise OllamaConnectionError(self.base_url, str(e))
@@ -54,6 +67,34 @@ class OllamaService:
     async def get_models(self) -> List[Dict]:
         """
         Get list of available Ollama models.
+        Results are reused for MODELS_CACHE_TTL seconds, and concurrent callers
+        share a single in-flight request.
+
+        Returns:
+            List[Dict]: List of model information
+
+        Raises:
+            OllamaConnectionError: If unable to connect to Ollama
+        """
+        if self._models_cache is not None:
+            expires_at, models = self._models_cache
+            if time.monotonic() < expires_at:
+                return models
+
+        if self._models_inflight is None:
+            self._models_inflight = asyncio.ensure_future(self._fetch_models())
+            self._models_inflight.add_done_callback(self._clear_models_inflight)
+        # Shield so one caller being cancelled doesn't cancel the shared request
+        return await asyncio.shield(self._models_inflight)
+
+    def _clear_models_inflight(self, task: "asyncio.Future[List[Dict]]") -> None:
+        """Forget the finished model list request so the next miss starts a new one."""
+        if self._models_inflight is task:
+            self._models_inflight = None
+
+    async def _fetch_models(self) -> List[Dict]:
+        """
+        Fetch the model list from Ollama and refresh the cache.
 
         Returns:
             List[Dict]: List of model information
@@ -64,6 +105,7 @@ class OllamaService:
         try:
             response = await self.client.list()
             models = response.get("models", [])
+            self._models_cache = (time.monotonic() + MODELS_CACHE_TTL, models)
             logger.info(f"Retrieved {len(models)} models from Ollama")
             return models
         except Exception as e:
@@ -29,8 +29,8 @@ export interface ChatWithMessages extends Chat {
 
 export interface ChatListResponse {
   chats: Chat[]
-  total: number
+  total: number | null
   page: number
   page_size: number
-  total_pages: number
+  total_pages: number | null
 }
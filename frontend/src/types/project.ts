@@ -60,8 +60,8 @@ export interface ProjectUpdate {
 
 export interface ProjectListResponse {
   projects: ProjectResponse[]
-  total: number
+  total: number | null
   page: number
   page_size: number
-  total_pages: number
+  total_pages: number | null
 }